@@ -0,0 +1,65 @@
+"""Reads/sec of forward_batch against calling forward once per read
+
+Run from the repository root:
+    python benchmarks/forward_batch.py --reads 20000 --min-length 100 --max-length 150
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from hmm.forward import forward, forward_batch  # noqa: E402
+from hmm.model import HMM  # noqa: E402
+
+
+def make_model():
+    states = ["H", "L"]
+    start_prob = {"H": 0.5, "L": 0.5}
+    transition_prob = {"H": {"H": 0.5, "L": 0.5}, "L": {"H": 0.4, "L": 0.6}}
+    emission_prob = {
+        "H": {"A": 0.2, "C": 0.3, "G": 0.3, "T": 0.2},
+        "L": {"A": 0.3, "C": 0.2, "G": 0.2, "T": 0.3}
+    }
+    return HMM.from_dicts(states, start_prob, transition_prob, emission_prob)
+
+
+def make_reads(n_reads, min_length, max_length, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(min_length, max_length + 1, size=n_reads)
+    alphabet = np.array(list("ACGT"))
+    return ["".join(alphabet[rng.integers(0, 4, size=length)]) for length in lengths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--min-length", type=int, default=100)
+    parser.add_argument("--max-length", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=8192)
+    args = parser.parse_args()
+
+    model = make_model()
+    reads = make_reads(args.reads, args.min_length, args.max_length)
+
+    start = time.perf_counter()
+    looped = np.array([forward(model, read) for read in reads])
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = forward_batch(model, reads, batch_size=args.batch_size)
+    batch_time = time.perf_counter() - start
+
+    assert np.allclose(looped, batched, rtol=1e-10, atol=0.0)
+
+    print(f"reads: {args.reads}, length: {args.min_length}-{args.max_length}")
+    print(f"per-read loop : {args.reads / loop_time:12.0f} reads/sec ({loop_time:.3f}s)")
+    print(f"forward_batch : {args.reads / batch_time:12.0f} reads/sec ({batch_time:.3f}s)")
+    print(f"speedup       : {loop_time / batch_time:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Import time of the algorithm entry points, checked against a budget
+
+Each module is imported in a fresh interpreter under `python -X importtime`.
+A module fails the check if its import takes longer than the budget, pulls in
+a display library, or prints anything.
+
+Run from the repository root:
+    python benchmarks/import_time.py --budget-ms 250
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+MODULES = [
+    "fwd.fwd",
+    "fwd.shorter",
+    "viterbi.bwd",
+    "viterbi.shorter",
+    "mdp.mdp",
+    "finals.all_algos",
+    "fuzzy_controller.exam",
+    "fuzzy_controller.main",
+    "fuzzy_controller.visualization",
+    "hmm.forward",
+    "hmm.viterbi",
+]
+
+# Only imported when a report or plot is requested
+DISPLAY_LIBRARIES = ("tabulate", "matplotlib", "streamlit")
+
+
+def measure(module):
+    """(cumulative import time in ms, imported top-level packages, printed output) of one fresh import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC, capture_output=True, text=True, check=True,
+    )
+    milliseconds, imported = None, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name.strip().split(".")[0])
+        if name == f" {module}":  # the top-level entry; nested imports are indented further
+            milliseconds = int(cumulative) / 1000
+    return milliseconds, imported, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--repeat", type=int, default=3, help="fresh imports per module, the fastest one counts")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'module':34} {'ms':>8}  notes")
+    for module in MODULES:
+        runs = [measure(module) for _ in range(args.repeat)]
+        milliseconds = min(run[0] for run in runs)
+        _, imported, output = runs[-1]
+
+        notes = []
+        if milliseconds > args.budget_ms:
+            notes.append(f"over budget ({args.budget_ms:.0f} ms)")
+        notes += [f"imports {library}" for library in DISPLAY_LIBRARIES if library in imported]
+        if output:
+            notes.append(f"prints {len(output.splitlines())} lines")
+        failures += bool(notes)
+        print(f"{module:34} {milliseconds:8.1f}  {', '.join(notes) or 'ok'}")
+
+    if failures:
+        print(f"\n{failures} of {len(MODULES)} modules failed the import check")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Sweeps/sec of process-parallel value iteration against the single-process sparse backend
+
+Runs a fixed number of sweeps on a random sparse MDP for each worker count.
+Start-up (forking the workers and handing them their rows) is part of the
+measured time, so use enough sweeps for it to amortize. Speedups need as
+many free cores as workers.
+
+Run from the repository root:
+    python benchmarks/parallel_value_iteration.py --states 1000000 --workers 1 2 4 8 16 32 --sweeps 50
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mdp import compiled, parallel  # noqa: E402
+from value_iteration import make_triplets  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--sweeps", type=int, default=50)
+    args = parser.parse_args()
+
+    *triplets, rewards = make_triplets(args.states)
+    mdp = compiled.from_triplets(args.states, 2, *triplets, rewards, sparse=True)
+    serial_values, _, serial = compiled.value_iteration(mdp, iterations=args.sweeps, threshold=-1)
+    serial_rate = args.sweeps / serial["seconds"]
+
+    print(f"{os.cpu_count()} cores, {args.states} states, {args.sweeps} sweeps")
+    print(f"{'workers':>8} {'sweeps/sec':>12} {'speedup':>8} {'max diff':>9}")
+    print(f"{'serial':>8} {serial_rate:12.1f} {1:8.2f} {0:9.1e}")
+    for workers in args.workers:
+        values, _, stats = parallel.value_iteration(mdp, iterations=args.sweeps, threshold=-1, workers=workers)
+        rate = args.sweeps / stats["seconds"]
+        print(f"{workers:8} {rate:12.1f} {rate / serial_rate:8.2f} {np.max(np.abs(values - serial_values)):9.1e}")
+
+
+if __name__ == "__main__":
+    main()
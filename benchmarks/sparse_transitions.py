@@ -0,0 +1,73 @@
+"""Dense against CSR transitions for forward and Viterbi on a profile-style model
+
+The model is built from a CSR matrix, so the sparse runs never allocate an
+N x N array; the dense transition arrays are only built for the dense runs.
+
+Run from the repository root:
+    python benchmarks/sparse_transitions.py --states 3000 --edges 4 --length 500
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from hmm.forward import forward_scaled  # noqa: E402
+from hmm.model import HMM  # noqa: E402
+from hmm.viterbi import viterbi  # noqa: E402
+
+
+def make_profile_model(n_states, n_edges, seed=0):
+    """Left-to-right model: each state moves to one of the next n_edges states (wrapping around)"""
+    from scipy import sparse
+
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n_states), n_edges)
+    cols = (rows + np.tile(np.arange(n_edges), n_states)) % n_states
+    probabilities = rng.dirichlet(np.ones(n_edges), size=n_states).ravel()
+    transition = sparse.csr_matrix((probabilities, (rows, cols)), shape=(n_states, n_states))
+    emission = rng.dirichlet(np.ones(4), size=n_states)
+    return HMM(range(n_states), "ACGT", np.full(n_states, 1 / n_states), transition, emission)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=3000)
+    parser.add_argument("--edges", type=int, default=4)
+    parser.add_argument("--length", type=int, default=500)
+    args = parser.parse_args()
+
+    model = make_profile_model(args.states, args.edges)
+    obs = np.random.default_rng(1).integers(0, 4, size=args.length).astype(np.uint8)
+    model.sparse_transition()  # build the CSR matrix outside the timings
+    print(f"states: {args.states}, edges per state: {args.edges}, length: {args.length}")
+
+    sparse, sparse_time = timed(forward_scaled, model, obs, sparse=True)
+    (sparse_path, _), sparse_viterbi_time = timed(viterbi, model, obs, sparse=True)
+    csr = model.sparse_transition()
+    # The model keeps A and A^T in CSR form
+    print(f"model transitions: {2 * (csr.data.nbytes + csr.indices.nbytes + csr.indptr.nbytes) / 2 ** 20:.1f} MiB as CSR, "
+          f"{2 * args.states ** 2 * 8 / 2 ** 20:.1f} MiB once the dense arrays are built")
+
+    model.log_transition  # build the dense arrays outside the timings
+    dense, dense_time = timed(forward_scaled, model, obs)
+    assert np.isclose(dense, sparse)
+    print(f"forward dense  : {dense_time:8.3f}s")
+    print(f"forward sparse : {sparse_time:8.3f}s ({dense_time / sparse_time:.1f}x)")
+
+    (dense_path, _), dense_time = timed(viterbi, model, obs)
+    assert (dense_path == sparse_path).all()
+    print(f"viterbi dense  : {dense_time:8.3f}s")
+    print(f"viterbi sparse : {sparse_viterbi_time:8.3f}s ({dense_time / sparse_viterbi_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Backups and wall time of Jacobi, Gauss-Seidel and prioritized-sweeping value iteration
+
+The MDP is a goal-directed grid world: four moves that go the intended way
+with probability 1 - slip and sideways otherwise, walls that bounce back,
+and a single terminal goal in one corner worth 1, every other state 0.
+Values only change in a wave spreading out from the goal, which is the
+case prioritized sweeping is meant for; the lower the slip, the sharper
+the wave. Every solver runs to the same residual threshold; the last
+column is the largest value difference from policy iteration.
+
+Run from the repository root:
+    python benchmarks/sweeping.py --sides 30 100 --slip 0.1 --discount 0.99
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mdp import compiled, policy, sweeping  # noqa: E402
+
+MOVES = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)])  # north, east, south, west
+
+
+def make_grid(side, slip=0.2):
+    """(action, state, next_state, probability, rewards) of a side x side grid world with its goal at (0, 0)"""
+    rows, columns = np.divmod(np.arange(side * side), side)
+    action, state, next_state, probability = [], [], [], []
+    for a in range(len(MOVES)):
+        # The intended move, then the two sideways ones
+        for move, p in ((a, 1 - slip), ((a + 1) % 4, slip / 2), ((a + 3) % 4, slip / 2)):
+            r = np.clip(rows + MOVES[move, 0], 0, side - 1)
+            c = np.clip(columns + MOVES[move, 1], 0, side - 1)
+            action.append(np.full(side * side, a))
+            state.append(np.arange(side * side))
+            next_state.append(r * side + c)
+            probability.append(np.full(side * side, p))
+
+    action, state, next_state, probability = (np.concatenate(a) for a in (action, state, next_state, probability))
+    keep = state != 0  # the goal is terminal
+    rewards = np.zeros(side * side)
+    rewards[0] = 1.0
+    return action[keep], state[keep], next_state[keep], probability[keep], rewards
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sides", type=int, nargs="+", default=[30, 100])
+    parser.add_argument("--slip", type=float, default=0.1)
+    parser.add_argument("--discount", type=float, default=0.99)
+    parser.add_argument("--threshold", type=float, default=1e-6)
+    args = parser.parse_args()
+    discount, threshold = args.discount, args.threshold
+
+    solvers = [
+        ("jacobi", lambda mdp: compiled.value_iteration(mdp, discount, 10 ** 6, threshold)),
+        ("gauss-seidel", lambda mdp: sweeping.gauss_seidel(mdp, discount, 10 ** 6, threshold)),
+        ("prioritized", lambda mdp: sweeping.prioritized_sweeping(mdp, discount, threshold=threshold)),
+    ]
+
+    print(f"{'states':>8} {'solver':14} {'backups':>12} {'per state':>10} {'seconds':>9} {'max diff':>9}")
+    for side in args.sides:
+        *triplets, rewards = make_grid(side, args.slip)
+        mdp = compiled.from_triplets(side * side, len(MOVES), *triplets, rewards, sparse=True)
+        exact, _, _ = policy.policy_iteration(mdp, discount)
+        for name, solve in solvers:
+            values, _, stats = solve(mdp)
+            print(f"{mdp.n_states:8} {name:14} {stats['backups']:12} {stats['backups'] / mdp.n_states:10.1f} "
+                  f"{stats['seconds']:9.3f} {np.max(np.abs(values - exact)):9.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Sweeps/sec of the dict value_iteration loop against the compiled dense and sparse backends
+
+All of them run the same number of sweeps on the 4-state pu/pf/rf/ru example
+and on random MDPs with a few successors per state-action pair. Above
+--max-dense states only the sparse backend runs, on an MDP built straight
+from arrays.
+
+Run from the repository root:
+    python benchmarks/value_iteration.py --max-dense 10000 --max-states 1000000 --sweeps 20
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mdp import compiled  # noqa: E402
+from mdp.mdp import value_iteration  # noqa: E402
+
+EXAMPLE_TRANSITIONS = {
+    'pu': {'s': {'pu': 1}, 'a': {'pu': 0.5, 'pf': 0.5}},
+    'pf': {'s': {'rf': 0.5, 'pu': 0.5}, 'a': {'pf': 1}},
+    'rf': {'s': {'rf': 0.5, 'ru': 0.5}, 'a': {'pf': 1}},
+    'ru': {'s': {'ru': 0.5, 'pu': 0.5}, 'a': {'pu': 0.5, 'pf': 0.5}}
+}
+EXAMPLE_REWARDS = {'pu': 0, 'pf': 0, 'ru': 10, 'rf': 10}
+
+
+def make_triplets(n_states, n_actions=2, n_successors=4, seed=0):
+    """Random MDP arrays: every action leads to n_successors random states
+
+    Returns (action, state, next_state, probability, rewards) as taken by
+    compiled.from_triplets.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_states, n_actions, n_successors)
+    state, action, _ = np.indices(shape).reshape(3, -1)
+    next_state = rng.integers(0, n_states, size=state.size)
+    probability = rng.dirichlet(np.ones(n_successors), size=n_states * n_actions).ravel()
+    return action, state, next_state, probability, rng.normal(size=n_states)
+
+
+def make_mdp(n_states, n_actions=2, n_successors=4, seed=0):
+    """The same random MDP as make_triplets, as nested dicts"""
+    action, state, next_state, probability, rewards = make_triplets(n_states, n_actions, n_successors, seed)
+    transition = {s: {f"a{a}": {} for a in range(n_actions)} for s in range(n_states)}
+    for a, s, t, p in zip(action.tolist(), state.tolist(), next_state.tolist(), probability.tolist()):
+        outcomes = transition[s][f"a{a}"]
+        outcomes[t] = outcomes.get(t, 0.0) + p
+    return transition, dict(enumerate(rewards.tolist()))
+
+
+def sizes(max_states):
+    n = 100
+    while n <= max_states:
+        yield n
+        n *= 10
+
+
+def sweeps_per_second(function, sweeps):
+    start = time.perf_counter()
+    function()
+    return sweeps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-dense", type=int, default=10_000, help="largest MDP for the dict loop and dense backend")
+    parser.add_argument("--max-states", type=int, default=1_000_000)
+    parser.add_argument("--sweeps", type=int, default=20)
+    args = parser.parse_args()
+    sweeps = args.sweeps
+
+    print(f"{'problem':14} {'dict loop':>14} {'dense':>14} {'sparse':>14}  (sweeps/sec)")
+    problems = [("pu/pf/rf/ru", EXAMPLE_TRANSITIONS, EXAMPLE_REWARDS)]
+    problems += [(f"random {n}", *make_mdp(n)) for n in sizes(args.max_dense)]
+    for name, transition, rewards in problems:
+        loop = sweeps_per_second(lambda: value_iteration(transition, rewards, iterations=sweeps, threshold=-1), sweeps)
+        dense, sparse = (compiled.compile_mdp(transition, rewards, sparse=flag) for flag in (False, True))
+        rates = [sweeps_per_second(lambda: compiled.value_iteration(mdp, iterations=sweeps, threshold=-1), sweeps)
+                 for mdp in (dense, sparse)]
+        print(f"{name:14} {loop:14.0f} {rates[0]:14.0f} {rates[1]:14.0f}")
+
+    for n in sizes(args.max_states):
+        if n <= args.max_dense:
+            continue
+        *triplets, rewards = make_triplets(n)
+        mdp = compiled.from_triplets(n, 2, *triplets, rewards, sparse=True)
+        rate = sweeps_per_second(lambda: compiled.value_iteration(mdp, iterations=sweeps, threshold=-1), sweeps)
+        nbytes = sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes for m in mdp.transition)
+        print(f"{f'random {n}':14} {'-':>14} {'-':>14} {rate:14.1f}  CSR {nbytes / 2 ** 20:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
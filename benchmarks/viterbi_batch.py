@@ -0,0 +1,48 @@
+"""Reads/sec of viterbi_batch against calling viterbi once per read
+
+Run from the repository root:
+    python benchmarks/viterbi_batch.py --reads 20000 --min-length 100 --max-length 150
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from forward_batch import make_model, make_reads  # noqa: E402
+from hmm.viterbi import viterbi, viterbi_batch  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--min-length", type=int, default=100)
+    parser.add_argument("--max-length", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    model = make_model()
+    reads = make_reads(args.reads, args.min_length, args.max_length)
+
+    start = time.perf_counter()
+    looped = [viterbi(model, read) for read in reads]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    paths, scores = viterbi_batch(model, reads, batch_size=args.batch_size)
+    batch_time = time.perf_counter() - start
+
+    assert all((path == expected).all() for path, (expected, _) in zip(paths, looped))
+    assert np.allclose(scores, [score for _, score in looped])
+
+    print(f"reads: {args.reads}, length: {args.min_length}-{args.max_length}")
+    print(f"per-read loop : {args.reads / loop_time:12.0f} reads/sec ({loop_time:.3f}s)")
+    print(f"viterbi_batch : {args.reads / batch_time:12.0f} reads/sec ({batch_time:.3f}s)")
+    print(f"speedup       : {loop_time / batch_time:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Chunk-parallel Viterbi segmentation of one long sequence against a single viterbi call
+
+Run from the repository root:
+    python benchmarks/viterbi_chunked.py --length 20000000 --chunk-size 1000000 --overlap 4096
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from forward_batch import make_model  # noqa: E402
+from hmm.segment import viterbi_chunked  # noqa: E402
+from hmm.viterbi import viterbi  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=20_000_000)
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--overlap", type=int, default=1 << 12)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    model = make_model()
+    obs = np.random.default_rng(0).integers(0, 4, size=args.length).astype(np.uint8)
+
+    start = time.perf_counter()
+    expected, _ = viterbi(model, obs)
+    single_time = time.perf_counter() - start
+
+    path, stats = viterbi_chunked(model, obs, args.chunk_size, args.overlap, args.workers)
+    rates = [chunk["symbols_per_sec"] for chunk in stats["chunks"]]
+
+    print(f"length: {args.length}, chunks: {len(stats['chunks'])}, overlap: {args.overlap}")
+    print(f"single viterbi  : {args.length / single_time:12.0f} symbols/sec ({single_time:.3f}s)")
+    print(f"viterbi_chunked : {args.length / stats['wall_time']:12.0f} symbols/sec ({stats['wall_time']:.3f}s)")
+    print(f"per chunk       : {min(rates):12.0f} - {max(rates):.0f} symbols/sec")
+    print(f"re-decodes      : {stats['redecodes']} of {stats['boundaries']} boundaries")
+    print(f"path agreement  : {np.mean(path == expected):12.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,10 +70,6 @@ def fuzzify(value, sets):
     return {k: get_membership(value, v) for k, v in sets.items()}
 
 
-accuracy_fuzzy = fuzzify(ACCURACY, FUZZY_SETS)
-time_fuzzy = fuzzify(TIME, FUZZY_SETS)
-
-
 def apply_rules(accuracy_fuzzy, time_fuzzy):
     return {
         i: (min(accuracy_fuzzy[s], time_fuzzy[a]), o)
@@ -82,9 +78,6 @@ def apply_rules(accuracy_fuzzy, time_fuzzy):
     }
 
 
-rule_strengths = apply_rules(accuracy_fuzzy, time_fuzzy)
-
-
 def calculate_areas(rule_strengths):
     areas, weighted_areas = {}, {}
     for i, (strength, out) in rule_strengths.items():
@@ -107,42 +100,50 @@ def defuzzify(areas, weighted_areas):
     return sum(weighted_areas.values()) / total_area if total_area > 0 else 0
 
 
-areas, weighted_areas = calculate_areas(rule_strengths)
-difficulty = defuzzify(areas, weighted_areas)
-
-print(f"\n\nInputs:\n\tAccuracy = {ACCURACY}\n\tAnswer Time = {TIME}\n")
-print(f"Output:\n\tDifficulty = {difficulty:.2f}\n\n")
-
-print("Accuracy Fuzzy Values")
-print(f"Crisp Value of Accuracy: {ACCURACY}")
-print("Fuzzy Set\tMembership Value")
-for k, v in accuracy_fuzzy.items():
-    print(f"{k}\t\t{v:.2f}")
-print("\n")
-
-print("Answer Time Fuzzy Values")
-print(f"Crisp Value of Answer Time: {TIME}")
-print("Fuzzy Set\tMembership Value")
-for k, v in time_fuzzy.items():
-    print(f"{k}\t\t{v:.2f}")
-print("\n")
-
-print("Rule Strengths (only non-zero)")
-print("Rule No.\tFuzzy Set\tStrength")
-for k, (strength, fuzzy_set) in rule_strengths.items():
-    print(f"{k}\t\t{fuzzy_set}\t\t{strength:.2f}")
-print("\n")
-
-print("Area Values")
-print("Rule No.\tArea Value")
-for k, v in areas.items():
-    print(f"{k}\t\t{v:.2f}")
-print("\n")
-
-print("Weighted Areas Values")
-print("Rule No.\tWeighted Value")
-for k, v in weighted_areas.items():
-    print(f"{k}\t\t{v:.2f}")
-print("\n")
-
-print(f"Defuzzified Crisp Value of Difficulty is {difficulty:.2f}\n")
+def main():
+    accuracy_fuzzy = fuzzify(ACCURACY, FUZZY_SETS)
+    time_fuzzy = fuzzify(TIME, FUZZY_SETS)
+    rule_strengths = apply_rules(accuracy_fuzzy, time_fuzzy)
+    areas, weighted_areas = calculate_areas(rule_strengths)
+    difficulty = defuzzify(areas, weighted_areas)
+
+    print(f"\n\nInputs:\n\tAccuracy = {ACCURACY}\n\tAnswer Time = {TIME}\n")
+    print(f"Output:\n\tDifficulty = {difficulty:.2f}\n\n")
+
+    print("Accuracy Fuzzy Values")
+    print(f"Crisp Value of Accuracy: {ACCURACY}")
+    print("Fuzzy Set\tMembership Value")
+    for k, v in accuracy_fuzzy.items():
+        print(f"{k}\t\t{v:.2f}")
+    print("\n")
+
+    print("Answer Time Fuzzy Values")
+    print(f"Crisp Value of Answer Time: {TIME}")
+    print("Fuzzy Set\tMembership Value")
+    for k, v in time_fuzzy.items():
+        print(f"{k}\t\t{v:.2f}")
+    print("\n")
+
+    print("Rule Strengths (only non-zero)")
+    print("Rule No.\tFuzzy Set\tStrength")
+    for k, (strength, fuzzy_set) in rule_strengths.items():
+        print(f"{k}\t\t{fuzzy_set}\t\t{strength:.2f}")
+    print("\n")
+
+    print("Area Values")
+    print("Rule No.\tArea Value")
+    for k, v in areas.items():
+        print(f"{k}\t\t{v:.2f}")
+    print("\n")
+
+    print("Weighted Areas Values")
+    print("Rule No.\tWeighted Value")
+    for k, v in weighted_areas.items():
+        print(f"{k}\t\t{v:.2f}")
+    print("\n")
+
+    print(f"Defuzzified Crisp Value of Difficulty is {difficulty:.2f}\n")
+
+
+if __name__ == "__main__":
+    main()
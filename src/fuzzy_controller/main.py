@@ -42,13 +42,6 @@ def fuzzify(value, sets):
     return {k: get_membership(value, v) for k, v in sets.items()}
 
 
-speed_fuzzy = fuzzify(SPEED_DIFF, FUZZY_SETS)
-print("Speed Fuzzy Values:\n", speed_fuzzy, "\n")
-
-accel_fuzzy = fuzzify(ACCELERATION, FUZZY_SETS)
-print("Acceleration Fuzzy Values:\n", accel_fuzzy, "\n")
-
-
 # Step 2: Apply Rules
 # s = speed, a = acceleration, o = output
 def apply_rules(speed_fuzzy, accel_fuzzy):
@@ -56,10 +49,6 @@ def apply_rules(speed_fuzzy, accel_fuzzy):
             min(speed_fuzzy[s], accel_fuzzy[a]) > 0}
 
 
-rule_strengths = apply_rules(speed_fuzzy, accel_fuzzy)
-print("Rule Strengths:\n", rule_strengths, "\n")
-
-
 # Step 3: Calculate Areas
 def calculate_areas(rule_strengths):
     areas, weighted_areas = {}, {}
@@ -85,13 +74,29 @@ def defuzzify(areas, weighted_areas):
     return sum(weighted_areas.values()) / total_area if total_area > 0 else 0
 
 
-# Execute and Print
-areas, weighted_areas = calculate_areas(rule_strengths)
-throttle = defuzzify(areas, weighted_areas)
+def main():
+    # Step 1: Fuzzification
+    speed_fuzzy = fuzzify(SPEED_DIFF, FUZZY_SETS)
+    print("Speed Fuzzy Values:\n", speed_fuzzy, "\n")
+
+    accel_fuzzy = fuzzify(ACCELERATION, FUZZY_SETS)
+    print("Acceleration Fuzzy Values:\n", accel_fuzzy, "\n")
+
+    # Step 2: Apply Rules
+    rule_strengths = apply_rules(speed_fuzzy, accel_fuzzy)
+    print("Rule Strengths:\n", rule_strengths, "\n")
+
+    # Execute and Print
+    areas, weighted_areas = calculate_areas(rule_strengths)
+    throttle = defuzzify(areas, weighted_areas)
+
+    print(f"Throttle Output: {throttle:.2f}")
+    print("Speed Fuzzy:", {k: f"{v:.2f}" for k, v in speed_fuzzy.items() if v > 0})
+    print("Accel Fuzzy:", {k: f"{v:.2f}" for k, v in accel_fuzzy.items() if v > 0})
+    print("Rules:", {k: (f"{v[0]:.2f}", v[1]) for k, v in rule_strengths.items()})
+    print("Areas:", {k: f"{v:.2f}" for k, v in areas.items()})
+    print("Weighted Areas:", {k: f"{v:.2f}" for k, v in weighted_areas.items()})
+
 
-print(f"Throttle Output: {throttle:.2f}")
-print("Speed Fuzzy:", {k: f"{v:.2f}" for k, v in speed_fuzzy.items() if v > 0})
-print("Accel Fuzzy:", {k: f"{v:.2f}" for k, v in accel_fuzzy.items() if v > 0})
-print("Rules:", {k: (f"{v[0]:.2f}", v[1]) for k, v in rule_strengths.items()})
-print("Areas:", {k: f"{v:.2f}" for k, v in areas.items()})
-print("Weighted Areas:", {k: f"{v:.2f}" for k, v in weighted_areas.items()})
+if __name__ == "__main__":
+    main()
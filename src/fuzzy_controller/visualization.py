@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 # Membership Functions
@@ -44,18 +43,11 @@ def fuzzify(x, sets):
     return {k: get_membership(x, v) for k, v in sets.items()}
 
 
-speed_fuzzy = fuzzify(SPEED_DIFF, FUZZY_SETS)
-accel_fuzzy = fuzzify(ACCELERATION, FUZZY_SETS)
-
-
 def apply_rules(speed_fuzzy, accel_fuzzy):
     return {i: (min(speed_fuzzy[s], accel_fuzzy[a]), o) for i, (s, a, o) in RULES.items() if
             min(speed_fuzzy[s], accel_fuzzy[a]) > 0}
 
 
-rule_strengths = apply_rules(speed_fuzzy, accel_fuzzy)
-
-
 def calculate_areas(rule_strengths):
     areas, weighted_areas = {}, {}
     for i, (strength, out) in rule_strengths.items():
@@ -78,12 +70,10 @@ def defuzzify(areas, weighted_areas):
     return sum(weighted_areas.values()) / total_area if total_area > 0 else 0
 
 
-areas, weighted_areas = calculate_areas(rule_strengths)
-throttle = defuzzify(areas, weighted_areas)
-
-
 # Visualization
 def plot_fuzzy_sets(fuzzy_sets, title, highlight_x=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(8, 4))
     x_vals = np.linspace(0, 255, 500)
 
@@ -102,13 +92,24 @@ def plot_fuzzy_sets(fuzzy_sets, title, highlight_x=None):
     plt.show()
 
 
-# Plot speed fuzzy sets
-plot_fuzzy_sets(FUZZY_SETS, "Speed Difference Fuzzy Sets")
+def main():
+    speed_fuzzy = fuzzify(SPEED_DIFF, FUZZY_SETS)
+    accel_fuzzy = fuzzify(ACCELERATION, FUZZY_SETS)
+    rule_strengths = apply_rules(speed_fuzzy, accel_fuzzy)
+    areas, weighted_areas = calculate_areas(rule_strengths)
+    throttle = defuzzify(areas, weighted_areas)
+
+    # Plot speed fuzzy sets
+    plot_fuzzy_sets(FUZZY_SETS, "Speed Difference Fuzzy Sets")
+
+    # Plot acceleration fuzzy sets
+    plot_fuzzy_sets(FUZZY_SETS, "Acceleration Fuzzy Sets")
+
+    # Plot throttle fuzzy sets with the final output
+    plot_fuzzy_sets(FUZZY_SETS, "Throttle Output Fuzzy Sets", highlight_x=throttle)
 
-# Plot acceleration fuzzy sets
-plot_fuzzy_sets(FUZZY_SETS, "Acceleration Fuzzy Sets")
+    print(f"Throttle Output: {throttle:.2f}")
 
-# Plot throttle fuzzy sets with the final output
-plot_fuzzy_sets(FUZZY_SETS, "Throttle Output Fuzzy Sets", highlight_x=throttle)
 
-print(f"Throttle Output: {throttle:.2f}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import numpy as np
+
+from hmm.viterbi import index_dtype
+
+
+def viterbi_beam(model, sequence, beam_width=None, threshold=None):
+    """Beam-pruned Viterbi for large state spaces
+
+    After each step only the beam_width best states and/or the states
+    within `threshold` (log2) of the best one survive. Only the successors
+    of surviving states are expanded, using the model's CSR successor
+    lists, so a step costs O(edges out of the beam) instead of O(N^2).
+    With neither limit set the result is exact.
+
+    Returns the path, its log2 score and the number of surviving states
+    per step, to tune the beam against exact decoding.
+    """
+    obs = model.encode(sequence)
+    indptr, next_states, log_weights = model.successors()
+    dtype = index_dtype(model.n_states)
+    survivors = np.empty(len(obs), dtype=np.intp)
+    if len(obs) == 0:
+        return np.empty(0, dtype=dtype), 0.0, survivors
+
+    # Initialization
+    delta = model.log_start + model.log_emission[:, obs[0]]
+    active = np.flatnonzero(np.isfinite(delta))
+    active, scores = _prune(active, delta[active], beam_width, threshold)
+    if len(active) == 0:
+        raise ValueError("Beam emptied at position 0: sequence has zero probability under the model")
+    survivors[0] = len(active)
+    history = [(active.astype(dtype), None)]
+
+    # Recursion over the successors of the surviving states
+    for t in range(1, len(obs)):
+        starts = indptr[active]
+        counts = indptr[active + 1] - starts
+        source = np.repeat(np.arange(len(active)), counts)
+        edges = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - starts, counts)
+        targets = next_states[edges]
+        candidates = scores[source] + log_weights[edges]
+
+        # Best candidate per target state (stable sort keeps the lowest source on ties)
+        order = np.lexsort((-candidates, targets))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = targets[order[1:]] != targets[order[:-1]]
+        best = order[first]
+
+        states = targets[best]
+        new_scores = candidates[best] + model.log_emission[states, obs[t]]
+        previous = active[source[best]]
+
+        finite = np.isfinite(new_scores)
+        keep = _prune_mask(new_scores[finite], beam_width, threshold)
+        active, scores, previous = states[finite][keep], new_scores[finite][keep], previous[finite][keep]
+        if len(active) == 0:
+            raise ValueError(f"Beam emptied at position {t}: sequence has zero probability under the model")
+
+        survivors[t] = len(active)
+        history.append((active.astype(dtype), previous.astype(dtype)))
+
+    # Traceback through the per-step survivor lists
+    best = int(np.argmax(scores))
+    state, score = active[best], scores[best]
+    path = np.empty(len(obs), dtype=dtype)
+    for t in range(len(obs) - 1, 0, -1):
+        states, previous = history[t]
+        path[t] = state
+        state = previous[np.searchsorted(states, state)]
+    path[0] = state
+
+    return path, score, survivors
+
+
+def _prune(states, scores, beam_width, threshold):
+    keep = _prune_mask(scores, beam_width, threshold)
+    return states[keep], scores[keep]
+
+
+def _prune_mask(scores, beam_width, threshold):
+    """Indices of the surviving entries, in their original (state) order"""
+    keep = np.arange(len(scores))
+    if len(scores) == 0:
+        return keep
+    if threshold is not None:
+        keep = keep[scores >= scores.max() - threshold]
+    if beam_width is not None and len(keep) > beam_width:
+        top = np.argpartition(-scores[keep], beam_width - 1)[:beam_width]
+        keep = np.sort(keep[top])
+    return keep
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from hmm.trellis import SUM_PRODUCT, sweep
+
+
+class _Node:
+    __slots__ = ("parent", "symbol", "children", "alpha", "log_likelihood")
+
+    def __init__(self, parent, symbol, alpha, log_likelihood):
+        self.parent = parent
+        self.symbol = symbol
+        self.children = {}
+        self.alpha = alpha                    # normalized alpha after this prefix, (1, N)
+        self.log_likelihood = log_likelihood  # log2 P(prefix)
+
+
+class PrefixForwardCache:
+    """Forward scoring that resumes from the longest cached prefix of each read
+
+    A trie keyed by symbol holds, for every cached prefix, the normalized
+    alpha vector and the prefix's log2 likelihood. Scoring a read walks the
+    trie as far as it matches and runs the scaled forward recursion only
+    over the remaining symbols, caching each new prefix on the way.
+
+    Nodes are evicted least recently used first once the cache holds more
+    than max_bytes. Each lookup touches its nodes from the deepest one up to
+    the root, so a node is always more recent than its descendants and the
+    LRU node is always a leaf that can be dropped without orphaning others.
+    """
+
+    # Approximate bytes per node besides its alpha vector (node object, dict entries)
+    NODE_OVERHEAD = 256
+
+    def __init__(self, model, max_bytes=64 << 20):
+        self.model = model
+        self.max_bytes = max_bytes
+        self.root = _Node(None, None, None, 0.0)
+        self.nbytes = 0
+        self._lru = OrderedDict()
+
+        self.reads = 0
+        self.hits = 0
+        self.columns_saved = 0
+        self.columns_computed = 0
+
+    def score(self, sequence):
+        """Log2 likelihood of one read"""
+        obs = self.model.encode(sequence)
+
+        # Walk down the longest cached prefix
+        node, path = self.root, []
+        for symbol in obs:
+            child = node.children.get(symbol)
+            if child is None:
+                break
+            node = child
+            path.append(node)
+        depth = len(path)
+
+        # Resume the scaled recursion from there, caching every new prefix
+        rest = obs[depth:]
+        if len(rest):
+            alphas = np.empty((len(rest), 1, self.model.n_states))
+            scales = np.empty((len(rest), 1))
+            sweep(SUM_PRODUCT, self.model, rest[None], node.alpha, out=alphas, scales=scales)
+            with np.errstate(divide="ignore"):
+                log_likelihoods = node.log_likelihood + np.cumsum(np.log2(scales[:, 0]))
+            for symbol, alpha, log_likelihood in zip(rest, alphas, log_likelihoods):
+                child = _Node(node, symbol, alpha.copy(), log_likelihood)
+                node.children[symbol] = child
+                self.nbytes += child.alpha.nbytes + self.NODE_OVERHEAD
+                node = child
+                path.append(node)
+
+        # Deepest node first, so ancestors end up more recent than descendants
+        for visited in reversed(path):
+            self._lru[visited] = None
+            self._lru.move_to_end(visited)
+        self._evict()
+
+        self.reads += 1
+        self.hits += depth > 0
+        self.columns_saved += depth
+        self.columns_computed += len(rest)
+        return node.log_likelihood
+
+    def score_many(self, sequences):
+        return np.array([self.score(sequence) for sequence in sequences])
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._lru:
+            node, _ = self._lru.popitem(last=False)
+            del node.parent.children[node.symbol]
+            self.nbytes -= node.alpha.nbytes + self.NODE_OVERHEAD
+
+    def stats(self):
+        """Hit rate and the number of alpha columns saved by the cache"""
+        columns = self.columns_saved + self.columns_computed
+        return {
+            "reads": self.reads,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.reads if self.reads else 0.0,
+            "columns_saved": self.columns_saved,
+            "columns_computed": self.columns_computed,
+            "column_hit_rate": self.columns_saved / columns if columns else 0.0,
+            "nodes": len(self._lru),
+            "nbytes": self.nbytes,
+        }
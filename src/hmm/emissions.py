@@ -0,0 +1,179 @@
+import numpy as np
+
+from hmm.trellis import MAX_PLUS, SUM_PRODUCT, logsumexp2, sweep
+from hmm.viterbi import index_dtype, traceback
+
+# Rows of the series whose log-emission matrix is built in one vectorized pass
+EMISSION_CHUNK = 1 << 12
+
+LOG2_E = 1 / np.log(2)
+
+
+class Gaussian:
+    """One Gaussian per state with diagonal covariance
+
+    means and variances are (N, D) arrays, or (N,) for univariate series.
+    dtype=np.float32 keeps the parameters and every matrix computed from
+    them in single precision.
+    """
+
+    def __init__(self, means, variances, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.means = _as_rows(means, self.dtype)
+        self.precision = 1 / _as_rows(variances, self.dtype)
+        # log2 normalizer of each state's density
+        self.constant = (0.5 * LOG2_E * np.log(self.precision / (2 * np.pi)).sum(axis=-1)).astype(self.dtype)
+
+    @property
+    def n_states(self):
+        return len(self.means)
+
+    @property
+    def n_dims(self):
+        return self.means.shape[-1]
+
+    def log_likelihood(self, series, chunk_size=EMISSION_CHUNK, out=None):
+        """(T, N) matrix of log2 densities, chunk_size rows at a time"""
+        return _chunked(self._block, _as_series(series, self.n_dims, self.dtype), self.n_states, chunk_size, out)
+
+    def _block(self, x):
+        diff = x[:, None, :] - self.means
+        return self.constant - (0.5 * LOG2_E) * np.einsum("tnd,tnd,nd->tn", diff, diff, self.precision)
+
+
+class GaussianMixture:
+    """Mixture of K diagonal Gaussians per state
+
+    weights is (N, K), means and variances are (N, K, D). Component
+    densities are combined with a log-sum-exp over K, so the mixture
+    never underflows.
+    """
+
+    def __init__(self, weights, means, variances, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.log_weights = np.log2(np.asarray(weights, dtype=self.dtype))
+        self.means = np.asarray(means, dtype=self.dtype)
+        self.precision = 1 / np.asarray(variances, dtype=self.dtype)
+        self.constant = (0.5 * LOG2_E * np.log(self.precision / (2 * np.pi)).sum(axis=-1)).astype(self.dtype)
+
+    @property
+    def n_states(self):
+        return self.means.shape[0]
+
+    @property
+    def n_dims(self):
+        return self.means.shape[-1]
+
+    def log_likelihood(self, series, chunk_size=EMISSION_CHUNK, out=None):
+        """(T, N) matrix of log2 densities, chunk_size rows at a time"""
+        return _chunked(self._block, _as_series(series, self.n_dims, self.dtype), self.n_states, chunk_size, out)
+
+    def _block(self, x):
+        diff = x[:, None, None, :] - self.means
+        components = self.constant - (0.5 * LOG2_E) * np.einsum("tnkd,tnkd,nkd->tnk", diff, diff, self.precision)
+        return logsumexp2(components + self.log_weights, axis=-1)
+
+
+class ContinuousHMM:
+    """HMM whose states emit real-valued vectors through a Gaussian or GaussianMixture
+
+    Decoding runs the same trellis sweep as the discrete models: each chunk
+    of the series becomes a _Frame whose emission rows are that chunk's
+    log-emission matrix, indexed by position instead of by symbol.
+    """
+
+    def __init__(self, states, start, transition, emissions):
+        self.states = list(states)
+        self.emissions = emissions
+        self.start, self.transition = (np.ascontiguousarray(a, dtype=float) for a in (start, transition))
+        with np.errstate(divide="ignore"):
+            self.log_start, self.log_transition = np.log2(self.start), np.log2(self.transition)
+
+    @property
+    def n_states(self):
+        return len(self.states)
+
+    def frame(self, series):
+        """Model view of one chunk of the series, for sweep()"""
+        return _Frame(self, self.emissions.log_likelihood(series))
+
+    def decode(self, path):
+        return [self.states[i] for i in path]
+
+
+class _Frame:
+    """Discrete-looking model over one chunk: symbol t is the chunk's t-th vector
+
+    The linear emission table is shifted by each row's peak so it cannot
+    underflow; `shift` holds the per-row log2 offsets to add back once
+    the table has been built.
+    """
+
+    def __init__(self, model, log_emission_t):
+        self.n_states = model.n_states
+        self.start, self.transition = model.start, model.transition
+        self.log_start, self.log_transition = model.log_start, model.log_transition
+        self.log_emission = log_emission_t.T
+        self.obs = np.arange(len(log_emission_t))
+        self._emission = None
+        self.shift = None
+
+    @property
+    def emission(self):
+        if self._emission is None:
+            self.shift = self.log_emission.max(axis=0)
+            self.shift[np.isneginf(self.shift)] = 0.0
+            self._emission = np.exp2(self.log_emission - self.shift)
+        return self._emission
+
+
+def forward_continuous(model, series, chunk_size=EMISSION_CHUNK, dtype=None):
+    """Log2 likelihood of a real-valued series via the scaled forward recursion"""
+    alpha = None
+    log_likelihood = 0.0
+    scales = np.empty(chunk_size, dtype=dtype)
+    for lo in range(0, len(series), chunk_size):
+        frame = model.frame(series[lo:lo + chunk_size])
+        out = scales[:len(frame.obs)]
+        alpha = sweep(SUM_PRODUCT, frame, frame.obs[None], alpha, scales=out[:, None], dtype=dtype)
+        with np.errstate(divide="ignore"):
+            log_likelihood += np.log2(out).sum() + frame.shift.sum()
+    return float(log_likelihood)
+
+
+def viterbi_continuous(model, series, chunk_size=EMISSION_CHUNK, dtype=None):
+    """Most likely state path of a real-valued series and its log2 score"""
+    backpointers = np.empty((len(series), 1, model.n_states), dtype=index_dtype(model.n_states))
+    delta = None
+    for lo in range(0, len(series), chunk_size):
+        frame = model.frame(series[lo:lo + chunk_size])
+        delta = sweep(
+            MAX_PLUS, frame, frame.obs[None], delta, backpointers=backpointers[lo:lo + chunk_size], dtype=dtype
+        )
+    if delta is None:
+        return np.empty(0, dtype=backpointers.dtype), 0.0
+    last = int(np.argmax(delta[0]))
+    return traceback(backpointers[:, 0], last), float(delta[0, last])
+
+
+def _as_rows(a, dtype):
+    a = np.asarray(a, dtype=dtype)
+    return a[:, None] if a.ndim == 1 else a
+
+
+def _as_series(series, n_dims, dtype):
+    """(T, D) view of the series; a 1-D series is univariate"""
+    series = np.asarray(series, dtype=dtype)
+    if series.ndim == 1 and n_dims == 1:
+        series = series[:, None]
+    if series.ndim != 2 or series.shape[1] != n_dims:
+        raise ValueError(f"Expected a (T, {n_dims}) series, got shape {series.shape}")
+    return series
+
+
+def _chunked(block, series, n_states, chunk_size, out):
+    if out is None:
+        out = np.empty((len(series), n_states), dtype=series.dtype)
+    for lo in range(0, len(series), chunk_size):
+        out[lo:lo + chunk_size] = block(series[lo:lo + chunk_size])
+    return out
@@ -0,0 +1,114 @@
+import mmap
+import os
+from contextlib import contextmanager
+
+import numpy as np
+
+from hmm.model import UNKNOWN
+from hmm.trellis import CHUNK_SIZE
+
+# Ingest table entry for whitespace, dropped while encoding
+SKIP = 254
+
+WHITESPACE = b" \t\r\n\v\f"
+
+
+def ingest_table(model, ignore_case=True):
+    """The model's byte table extended for file input
+
+    Whitespace maps to SKIP and, with ignore_case, the other case of each
+    single-letter symbol maps to the same index unless it is a symbol itself
+    (so soft-masked lowercase bases decode like uppercase ones).
+    """
+    if model.byte_table is None:
+        raise ValueError("File input needs a model whose symbols are single bytes")
+    if len(model.symbols) >= SKIP:
+        raise ValueError("Too many symbols for the byte table")
+    table = model.byte_table.copy()
+    if ignore_case:
+        for code in range(256):
+            other = ord(chr(code).swapcase()) if code < 128 else code
+            if table[code] == UNKNOWN and table[other] != UNKNOWN:
+                table[code] = table[other]
+    table[np.frombuffer(WHITESPACE, dtype=np.uint8)] = SKIP
+    return table
+
+
+def records(buffer):
+    """Yields (header, body start, body end) byte offsets of each FASTA record
+
+    A buffer that does not start with '>' is raw text: one record with
+    header None spanning the whole buffer.
+    """
+    size = len(buffer)
+    if not size:
+        return
+    if buffer[:1] != b">":
+        yield None, 0, size
+        return
+
+    position = 0
+    while position < size:
+        header_end = buffer.find(b"\n", position)
+        header_end = size if header_end == -1 else header_end
+        following = buffer.find(b"\n>", header_end)
+        body_end = size if following == -1 else following + 1
+        yield bytes(buffer[position + 1:header_end]).decode().strip(), min(header_end + 1, size), body_end
+        position = body_end
+
+
+def read_fasta(path, model, chunk_size=CHUNK_SIZE, ignore_case=True):
+    """Yields (header, symbol indices) for each record of a FASTA or raw text file
+
+    The file is memory-mapped, never read into a Python string: each record
+    body is translated through the ingest table chunk by chunk, straight
+    from the mapped pages into the record's uint8 index array, with
+    newlines and other whitespace compacted out on the way. Only the
+    encoded record is held in memory; use iter_chunks for records that
+    should not be.
+    """
+    table = ingest_table(model, ignore_case)
+    with _mapped(path) as buffer:
+        for header, lo, hi in records(buffer):
+            obs = np.empty(hi - lo, dtype=np.uint8)
+            n = 0
+            for chunk in _encode_chunks(buffer, lo, hi, table, chunk_size):
+                obs[n:n + len(chunk)] = chunk
+                n += len(chunk)
+            yield header, obs[:n]
+
+
+def iter_chunks(path, model, chunk_size=CHUNK_SIZE, ignore_case=True):
+    """Yields (header, symbol indices) chunks of at most chunk_size input bytes
+
+    Consecutive chunks of one record carry the same header, so a stream of
+    any length can be fed to ForwardFilter or OnlineViterbi in O(chunk_size)
+    memory.
+    """
+    table = ingest_table(model, ignore_case)
+    with _mapped(path) as buffer:
+        for header, lo, hi in records(buffer):
+            for chunk in _encode_chunks(buffer, lo, hi, table, chunk_size):
+                if len(chunk):
+                    yield header, chunk
+
+
+def _encode_chunks(buffer, lo, hi, table, chunk_size):
+    for start in range(lo, hi, chunk_size):
+        # The lookup copies, so no view of the map outlives this line and it can be closed
+        codes = table[np.frombuffer(buffer, dtype=np.uint8, count=min(chunk_size, hi - start), offset=start)]
+        if codes.size and codes.max() == UNKNOWN:
+            offset = start + int(np.argmax(codes == UNKNOWN))
+            raise ValueError(f"Byte {chr(buffer[offset])!r} at offset {offset} is not in the model alphabet")
+        yield codes[codes != SKIP]
+
+
+@contextmanager
+def _mapped(path):
+    """Read-only memory map of a file, or empty bytes for an empty file"""
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
@@ -0,0 +1,49 @@
+import numpy as np
+
+from hmm.trellis import CHUNK_SIZE, SUM_PRODUCT, sweep
+
+
+class ForwardFilter:
+    """Online forward filter with O(N) state
+
+    Symbols arrive one at a time or in chunks; only the current normalized
+    alpha vector (the filtered posterior P(state_t | x_1..x_t)) and the
+    running log2 likelihood are kept, so memory does not grow with the stream.
+    """
+
+    def __init__(self, model, chunk_size=CHUNK_SIZE):
+        self.model = model
+        self.chunk_size = chunk_size
+        self._scales = np.empty(chunk_size)
+        self.reset()
+
+    def reset(self):
+        self.alpha = None
+        self.log_likelihood = 0.0
+        self.n_observed = 0
+
+    @property
+    def posterior(self):
+        """Filtered state distribution after the symbols seen so far"""
+        if self.alpha is None:
+            return self.model.start.copy()
+        return self.alpha[0].copy()
+
+    def update(self, symbols):
+        """Consumes a symbol or a chunk of symbols and returns the filtered posterior"""
+        obs = self.model.encode(symbols)
+
+        for lo in range(0, len(obs), self.chunk_size):
+            block = obs[lo:lo + self.chunk_size]
+            scales = self._scales[:len(block)]
+            self.alpha = sweep(SUM_PRODUCT, self.model, block[None], self.alpha, scales=scales[:, None])
+            with np.errstate(divide="ignore"):
+                self.log_likelihood += np.log2(scales).sum()
+            self.n_observed += len(block)
+
+        return self.posterior
+
+    def feed(self, stream):
+        """Consumes chunks from any iterable, yielding the filtered posterior after each one"""
+        for chunk in stream:
+            yield self.update(chunk)
@@ -0,0 +1,96 @@
+import numpy as np
+
+from hmm.trellis import CHUNK_SIZE, LOG_SUM_PRODUCT, SPARSE_SUM_PRODUCT, SUM_PRODUCT, active_rows, sweep
+
+
+def forward(model, sequence, dtype=None, sparse=False):
+    """Likelihood of a single sequence, vectorized over states
+
+    sparse=True steps with the CSR transition matrix, which pays off for
+    large models with few transitions per state.
+    """
+    obs = model.encode(sequence)
+    if len(obs) == 0:
+        return 1.0
+    alpha = sweep(_semiring(sparse), model, obs[None], dtype=dtype)
+    return SUM_PRODUCT.total(alpha)[0]
+
+
+def forward_trellis(model, sequence, dtype=None):
+    """Full (N, T) alpha table, used by the scripts that print it"""
+    obs = model.encode(sequence)
+    alpha = np.zeros((len(obs), 1, model.n_states), dtype=dtype)
+    sweep(SUM_PRODUCT, model, obs[None], out=alpha, dtype=dtype)
+    return alpha[:, 0].T
+
+
+def forward_batch(model, sequences, batch_size=8192, dtype=None, sparse=False):
+    """Likelihoods of many sequences, one (B, N) @ (N, N) matmul per time step
+
+    Sequences are padded into a (B, T) index array. Each block is sorted by
+    length so the rows still running at step t are a prefix of the block and
+    the length mask reduces to a slice.
+    """
+    sequences = list(sequences)
+    likelihoods = np.empty(len(sequences))
+
+    for lo in range(0, len(sequences), batch_size):
+        obs, lengths = model.encode_batch(sequences[lo:lo + batch_size])
+        order = np.argsort(-lengths, kind="stable")
+        obs, lengths = obs[order], lengths[order]
+
+        alpha = sweep(_semiring(sparse), model, obs, active=active_rows(lengths, obs.shape[1]), dtype=dtype)
+        if alpha is None:
+            likelihoods[lo + order] = 1.0
+            continue
+        alpha[lengths == 0] = model.start
+        likelihoods[lo + order] = SUM_PRODUCT.total(alpha)
+
+    return likelihoods
+
+
+def forward_scaled(model, sequence, chunk_size=CHUNK_SIZE, return_scales=False, dtype=None, sparse=False):
+    """Log2 likelihood via the scaled forward recursion
+
+    alpha is renormalized to sum to 1 at every step and the normalizer c_t
+    is kept, so log2 P(x) = sum_t log2 c_t and nothing underflows however
+    long the sequence is. Emission rows are gathered chunk by chunk, so
+    memory stays O(N * chunk_size) apart from the encoded sequence.
+    With return_scales=True the per-step log2 normalizers are returned too.
+    sparse=True is as in forward().
+    """
+    obs = model.encode(sequence)
+    scales = np.empty(len(obs)) if return_scales else np.empty(min(chunk_size, len(obs)))
+    alpha = None
+    log_likelihood = 0.0
+
+    for lo in range(0, len(obs), chunk_size):
+        block = obs[lo:lo + chunk_size]
+        out = scales[lo:lo + len(block)] if return_scales else scales[:len(block)]
+        alpha = sweep(_semiring(sparse), model, block[None], alpha, scales=out[:, None], dtype=dtype)
+        with np.errstate(divide="ignore"):
+            np.log2(out, out=out)
+        log_likelihood += out.sum()
+
+    if return_scales:
+        return log_likelihood, scales
+    return log_likelihood
+
+
+def forward_log(model, sequence, chunk_size=CHUNK_SIZE, dtype=None):
+    """Log2 likelihood via the forward recursion carried out in log2 space
+
+    Each step is a vectorized log-sum-exp over previous states: alpha is
+    shifted by its peak before leaving log space, so no step can underflow.
+    """
+    obs = model.encode(sequence)
+    if len(obs) == 0:
+        return 0.0
+    log_alpha = None
+    for lo in range(0, len(obs), chunk_size):
+        log_alpha = sweep(LOG_SUM_PRODUCT, model, obs[None, lo:lo + chunk_size], log_alpha, dtype=dtype)
+    return LOG_SUM_PRODUCT.total(log_alpha)[0]
+
+
+def _semiring(sparse):
+    return SPARSE_SUM_PRODUCT if sparse else SUM_PRODUCT
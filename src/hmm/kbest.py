@@ -0,0 +1,63 @@
+import heapq
+
+import numpy as np
+
+from hmm.viterbi import index_dtype
+
+
+def iter_kbest(model, sequence, k):
+    """Lazily yields up to k (path, log2 score) pairs, best first
+
+    The forward sweep keeps the k best partial scores per state in a
+    (N, k) array, with a (state, rank) backpointer for each of them. The
+    final N * k entries go into a heap and are popped one by one; each pop
+    is traced back through the backpointers, so asking for fewer paths
+    costs only those tracebacks. An empty sequence has a single, empty
+    path scoring 0.0; k <= 0 yields nothing.
+    """
+    obs = model.encode(sequence)
+    N = model.n_states
+    if k <= 0:
+        return
+    if len(obs) == 0:
+        yield np.empty(0, dtype=index_dtype(N)), 0.0
+        return
+    dtype = index_dtype(max(N, k))
+    back_state = np.zeros((len(obs), N, k), dtype=dtype)
+    back_rank = np.zeros((len(obs), N, k), dtype=dtype)
+
+    # Initialization: one path per state, the other ranks are empty
+    delta = np.full((N, k), -np.inf)
+    delta[:, 0] = model.log_start + model.log_emission[:, obs[0]]
+
+    # Recursion: best k of the N * k candidates flowing into each state
+    for t in range(1, len(obs)):
+        candidates = (delta[:, :, None] + model.log_transition[:, None, :]).reshape(N * k, N)
+        if N * k > k:
+            top = np.argpartition(-candidates, k - 1, axis=0)[:k]
+        else:
+            top = np.broadcast_to(np.arange(N * k)[:, None], (N * k, N))
+        scores = np.take_along_axis(candidates, top, axis=0)
+        order = np.argsort(-scores, axis=0, kind="stable")
+        top = np.take_along_axis(top, order, axis=0).T        # (N, k) flat (state, rank) index
+        delta = np.take_along_axis(scores, order, axis=0).T + model.log_emission[:, obs[t], None]
+        back_state[t], back_rank[t] = np.divmod(top, k)
+
+    # Lazy enumeration of the final entries
+    heap = [(-delta[state, rank], state, rank) for state in range(N) for rank in range(k)
+            if np.isfinite(delta[state, rank])]
+    heapq.heapify(heap)
+    for _ in range(k):
+        if not heap:
+            return
+        score, state, rank = heapq.heappop(heap)
+        path = np.empty(len(obs), dtype=index_dtype(N))
+        for t in range(len(obs) - 1, -1, -1):
+            path[t] = state
+            state, rank = back_state[t, state, rank], back_rank[t, state, rank]
+        yield path, -score
+
+
+def viterbi_kbest(model, sequence, k):
+    """The k most likely state paths with their log2 scores, best first"""
+    return list(iter_kbest(model, sequence, k))
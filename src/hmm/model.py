@@ -0,0 +1,201 @@
+import numpy as np
+
+# Byte table entry for bytes that are not a symbol of the model
+UNKNOWN = 255
+
+
+class HMM:
+    """Discrete HMM compiled from the nested probability dicts
+
+    Holds contiguous start, transition and emission arrays in linear and
+    log2 space (log2 matches the log probabilities used in src/viterbi),
+    plus a 256-entry byte -> symbol table so str/bytes sequences encode to
+    uint8 index arrays with a single vectorized lookup.
+
+    transition may also be a scipy sparse matrix (with log=True its stored
+    entries are log2 probabilities and missing ones are impossible). It is
+    then kept in CSR form only, so the sparse forward and Viterbi paths
+    need O(nnz) memory; the dense transition arrays are built on first use.
+    """
+
+    def __init__(self, states, symbols, start, transition, emission, log=False):
+        self.states = list(states)
+        self.symbols = list(symbols)
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        # start (N,), transition (N, N) with row = previous state, emission (N, M) with column = symbol
+        arrays = [np.ascontiguousarray(a, dtype=float) for a in (start, emission)]
+        if log:
+            self.log_start, self.log_emission = arrays
+            self.start, self.emission = (np.exp2(a) for a in arrays)
+        else:
+            self.start, self.emission = arrays
+            with np.errstate(divide="ignore"):
+                self.log_start, self.log_emission = (np.log2(a) for a in arrays)
+
+        self._csr = None
+        self._transition = self._log_transition = None
+        if hasattr(transition, "tocsr"):
+            self._csr = transition.tocsr().astype(float)  # astype copies, so the caller's matrix is untouched
+            if log:
+                self._csr.data = np.exp2(self._csr.data)
+            self._csr.eliminate_zeros()
+            self._csr.sort_indices()
+        elif log:
+            self._log_transition = np.ascontiguousarray(transition, dtype=float)
+            self._transition = np.exp2(self._log_transition)
+        else:
+            self._transition = np.ascontiguousarray(transition, dtype=float)
+            with np.errstate(divide="ignore"):
+                self._log_transition = np.log2(self._transition)
+
+        self.byte_table = self._build_byte_table()
+        self._successors = None
+        self._predecessors = None
+        self._sparse_transition = None
+
+    @classmethod
+    def from_dicts(cls, states, start_prob, transition_prob, emission_prob, log=False):
+        """Builds the model from the nested dicts used by the scripts
+
+        With log=True the dicts hold log2 probabilities, as in src/viterbi.
+        """
+        missing = -np.inf if log else 0.0
+        symbols = list(dict.fromkeys(symbol for state in states for symbol in emission_prob[state]))
+        start = [start_prob[state] for state in states]
+        transition = [[transition_prob[prev].get(curr, missing) for curr in states] for prev in states]
+        emission = [[emission_prob[state].get(symbol, missing) for symbol in symbols] for state in states]
+        return cls(states, symbols, start, transition, emission, log=log)
+
+    @property
+    def n_states(self):
+        return len(self.states)
+
+    @property
+    def transition(self):
+        if self._transition is None:
+            self._transition = self._csr.toarray()
+        return self._transition
+
+    @property
+    def log_transition(self):
+        if self._log_transition is None:
+            with np.errstate(divide="ignore"):
+                self._log_transition = np.log2(self.transition)
+        return self._log_transition
+
+    def successors(self):
+        """Outgoing transitions in CSR form: (indptr, next states, log2 probabilities)
+
+        The successors of state i are next_states[indptr[i]:indptr[i + 1]];
+        zero-probability transitions are left out.
+        """
+        if self._successors is None:
+            if self._csr is not None:
+                self._successors = (self._csr.indptr, self._csr.indices, np.log2(self._csr.data))
+            else:
+                rows, cols = np.nonzero(self.transition > 0)
+                indptr = np.searchsorted(rows, np.arange(self.n_states + 1))
+                self._successors = (indptr, cols, self.log_transition[rows, cols])
+        return self._successors
+
+    def predecessors(self):
+        """Incoming transitions in CSR form: (indptr, previous states, log2 probabilities)
+
+        The predecessors of state j are previous_states[indptr[j]:indptr[j + 1]],
+        in ascending order; zero-probability transitions are left out.
+        """
+        if self._predecessors is None:
+            if self._csr is not None:
+                incoming = self._csr.tocsc()
+                incoming.sort_indices()
+                self._predecessors = (incoming.indptr, incoming.indices, np.log2(incoming.data))
+            else:
+                cols, rows = np.nonzero(self.transition.T > 0)
+                indptr = np.searchsorted(cols, np.arange(self.n_states + 1))
+                self._predecessors = (indptr, rows, self.log_transition[rows, cols])
+        return self._predecessors
+
+    def log_transition_into(self, state):
+        """Column log_transition[:, state], without building the dense matrix of a sparse model"""
+        if self._csr is None:
+            return self.log_transition[:, state]
+        indptr, previous, log_weights = self.predecessors()
+        column = np.full(self.n_states, -np.inf)
+        column[previous[indptr[state]:indptr[state + 1]]] = log_weights[indptr[state]:indptr[state + 1]]
+        return column
+
+    def sparse_transition(self):
+        """Transposed transition matrix as a scipy CSR matrix (row = next state)"""
+        if self._sparse_transition is None:
+            from scipy import sparse
+
+            indptr, previous, log_weights = self.predecessors()
+            self._sparse_transition = sparse.csr_matrix(
+                (np.exp2(log_weights), previous, indptr), shape=(self.n_states, self.n_states)
+            )
+        return self._sparse_transition
+
+    def _build_byte_table(self):
+        if len(self.symbols) >= UNKNOWN:
+            return None
+        table = np.full(256, UNKNOWN, dtype=np.uint8)
+        for i, symbol in enumerate(self.symbols):
+            try:
+                code = symbol.encode("latin-1") if isinstance(symbol, str) else symbol
+            except UnicodeEncodeError:
+                return None  # a symbol outside latin-1 has no byte, so the dict path encodes
+            if not isinstance(code, bytes) or len(code) != 1:
+                return None
+            table[code[0]] = i
+        return table
+
+    def encode(self, sequence):
+        """Maps a sequence of symbols, or a single symbol, to an array of symbol indices"""
+        if isinstance(sequence, np.ndarray):
+            return np.atleast_1d(sequence)
+        if not hasattr(sequence, "__len__"):
+            sequence = [sequence]  # a single non-string symbol, e.g. an int
+        if self.byte_table is not None and isinstance(sequence, (str, bytes, bytearray, memoryview)):
+            return self._lookup(self._as_bytes(sequence))
+        return np.fromiter((self.symbol_index[symbol] for symbol in sequence), dtype=np.intp, count=len(sequence))
+
+    def _as_bytes(self, sequence):
+        if not isinstance(sequence, str):
+            return sequence
+        try:
+            return sequence.encode("latin-1")
+        except UnicodeEncodeError as error:
+            # No symbol of a byte table model lies outside latin-1
+            bad = error.object[error.start]
+            raise ValueError(f"Symbol {bad!r} is not in the model alphabet {self.symbols}") from None
+
+    def _lookup(self, raw):
+        obs = self.byte_table[np.frombuffer(raw, dtype=np.uint8)]
+        if obs.size and obs.max() == UNKNOWN:
+            bad = bytes(raw)[int(np.argmax(obs == UNKNOWN))]
+            raise ValueError(f"Symbol {chr(bad)!r} is not in the model alphabet {self.symbols}")
+        return obs
+
+    def encode_batch(self, sequences):
+        """Packs sequences into a padded (B, T) index array plus their lengths"""
+        sequences = list(sequences)
+        lengths = np.array([len(sequence) for sequence in sequences], dtype=np.intp)
+        width = lengths.max(initial=0)
+
+        if self.byte_table is not None and all(isinstance(s, (str, bytes)) for s in sequences):
+            obs = self._lookup(b"".join(self._as_bytes(s) for s in sequences))
+            if (lengths == width).all():
+                return obs.reshape(len(sequences), width), lengths
+            batch = np.zeros((len(sequences), width), dtype=np.uint8)
+            batch[np.arange(width) < lengths[:, None]] = obs
+            return batch, lengths
+
+        batch = np.zeros((len(sequences), width), dtype=np.intp)
+        for i, sequence in enumerate(sequences):
+            batch[i, :lengths[i]] = self.encode(sequence)
+        return batch, lengths
+
+    def decode(self, path):
+        """Maps state indices back to state names"""
+        return [self.states[i] for i in path]
@@ -0,0 +1,92 @@
+import numpy as np
+
+from hmm.trellis import MAX_PLUS
+from hmm.viterbi import index_dtype
+
+
+class OnlineViterbi:
+    """Fixed-lag streaming Viterbi decoder
+
+    Symbols are pushed incrementally. For each uncommitted column a ring
+    buffer of lag + 1 ancestor rows records, per current state, the state
+    its surviving path passes through at that column; every step updates
+    all rows with one gather through the new backpointers. Once all
+    surviving paths agree on a column, it and every column before it are
+    final and are emitted. If the oldest column has not converged within
+    `lag` columns, it is committed from the currently best path, which
+    bounds both latency and memory at the cost of possibly differing from
+    the offline path there.
+    """
+
+    def __init__(self, model, lag=64):
+        self.model = model
+        self.lag = lag
+        self._identity = np.arange(model.n_states, dtype=index_dtype(model.n_states))
+        self.reset()
+
+    def reset(self):
+        self.delta = None
+        self.n_observed = 0
+        self.n_forced = 0
+        self._start = 0  # first column not emitted yet
+        self._ancestors = np.empty((self.lag + 1, self.model.n_states), dtype=self._identity.dtype)
+
+    def push(self, symbols):
+        """Consumes a symbol or a chunk of symbols, returns the newly committed state indices"""
+        log_emission_t = self.model.log_emission.T[self.model.encode(symbols)]
+        committed = []
+
+        for log_emission in log_emission_t:
+            if self.delta is None:
+                self.delta = self.model.log_start + log_emission
+            else:
+                self.delta, backpointers = MAX_PLUS.argmatvec(self.delta, self.model.log_transition)
+                self.delta += log_emission
+                self._ancestors = self._ancestors[:, backpointers]
+            self._ancestors[self.n_observed % len(self._ancestors)] = self._identity
+            self.n_observed += 1
+
+            converged = self._converged_column()
+            if converged is not None:
+                committed.append(self._commit_through(*converged))
+            if self.n_observed - self._start > self.lag:
+                # Lag exceeded: commit the oldest column from the current best path
+                self.n_forced += 1
+                committed.append(self._commit_through(self._start, int(np.argmax(self.delta))))
+
+        return np.concatenate(committed) if committed else np.empty(0, dtype=self._identity.dtype)
+
+    def feed(self, stream):
+        """Consumes chunks from any iterable, yielding the labels committed after each one"""
+        for chunk in stream:
+            yield self.push(chunk)
+
+    def flush(self):
+        """Commits every remaining column from the best final state"""
+        if self.delta is None or self._start == self.n_observed:
+            return np.empty(0, dtype=self._identity.dtype)
+        return self._commit_through(self.n_observed - 1, int(np.argmax(self.delta)))
+
+    def _converged_column(self):
+        """Latest uncommitted column on which every surviving path agrees, and one surviving state"""
+        finite = np.isfinite(self.delta)
+        survivors = self._identity if finite.all() else np.flatnonzero(finite)
+        if not len(survivors):
+            return None
+        # Paths that agree on a column agree on every earlier one, so the
+        # oldest column is checked first and usually settles it
+        oldest = self._ancestors[self._start % len(self._ancestors)][survivors]
+        if (oldest != oldest[0]).any():
+            return None
+        columns = np.arange(self._start, self.n_observed)
+        rows = self._ancestors[columns % len(self._ancestors)][:, survivors]
+        agreed = (rows == rows[:, :1]).all(axis=1)
+        column = self.n_observed - 1 if agreed.all() else self._start + int(np.argmin(agreed)) - 1
+        return column, survivors[0]
+
+    def _commit_through(self, column, state):
+        """Emits columns start..column from the path of `state` at the latest column"""
+        columns = np.arange(self._start, column + 1)
+        labels = self._ancestors[columns % len(self._ancestors), state]
+        self._start = column + 1
+        return labels
@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from hmm.trellis import MAX_PLUS, SUM_PRODUCT
+
+# Semirings with a transfer-matrix product; sum-product matrices are kept
+# rescaled to a peak of 1 with a separate log2 scale, max-plus ones are log2
+SEMIRINGS = (SUM_PRODUCT, MAX_PLUS)
+
+
+def forward_parallel(model, sequence, workers=None, n_chunks=None):
+    """Log2 likelihood of one long sequence using every core"""
+    return parallel_scan(model, sequence, SUM_PRODUCT, workers, n_chunks)
+
+
+def viterbi_score_parallel(model, sequence, workers=None, n_chunks=None):
+    """Log2 score of the Viterbi path of one long sequence using every core
+
+    Only the score is computed; the path needs a traceback over the whole
+    sequence (see hmm.viterbi).
+    """
+    return parallel_scan(model, sequence, MAX_PLUS, workers, n_chunks)
+
+
+def parallel_scan(model, sequence, semiring, workers=None, n_chunks=None):
+    """Chunked parallel scan over the per-step semiring matrices
+
+    Step t multiplies the trellis vector by M_t = A * e(x_t) in the given
+    hmm.trellis semiring (SUM_PRODUCT or MAX_PLUS). The steps are split into
+    chunks; each worker process reduces its chunk to one N x N transfer
+    matrix and the parent combines them with a pairwise tree reduction. A step costs O(N^3) instead of O(N^2), so this
+    pays off for small state spaces and enough cores.
+    """
+    if semiring not in SEMIRINGS:
+        raise ValueError(f"Unsupported semiring {semiring!r}, expected one of {SEMIRINGS}")
+    obs = model.encode(sequence)
+    if len(obs) == 0:
+        return 0.0
+    workers = workers or os.cpu_count() or 1
+    n_chunks = max(1, min(n_chunks or workers, len(obs) - 1))
+    bounds = np.linspace(1, len(obs), n_chunks + 1).astype(np.intp)
+    chunks = [obs[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    if workers == 1:
+        transfers = [_chunk_transfer(model, chunk, semiring) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            transfers = list(executor.map(_chunk_transfer, repeat(model), chunks, repeat(semiring)))
+
+    # Tree reduction, combining neighbours so the product order is kept
+    while len(transfers) > 1:
+        paired = [_combine(a, b, semiring) for a, b in zip(transfers[::2], transfers[1::2])]
+        if len(transfers) % 2:
+            paired.append(transfers[-1])
+        transfers = paired
+    matrix, log_scale = transfers[0]
+
+    start, _, emission_t = semiring.parameters(model)
+    total = semiring.total(semiring.matvec(semiring.times(start, emission_t[obs[0]]), matrix))
+    if semiring.log:
+        return total
+    with np.errstate(divide="ignore"):
+        return np.log2(total) + log_scale
+
+
+def _chunk_transfer(model, obs, semiring):
+    """Reduces the steps of one chunk to an N x N transfer matrix and a log2 scale"""
+    _, transition, emission_t = semiring.parameters(model)
+    matrix = semiring.identity(model.n_states)
+    log_scale = 0.0
+    for symbol in obs:
+        matrix = semiring.times(semiring.matmul(matrix, transition), emission_t[symbol])
+        if not semiring.log:
+            matrix, log_scale = _rescale(matrix, log_scale)
+            if log_scale == -np.inf:
+                break
+    return matrix, log_scale
+
+
+def _combine(left, right, semiring):
+    (a, a_scale), (b, b_scale) = left, right
+    matrix = semiring.matmul(a, b)
+    if semiring.log:
+        return matrix, 0.0
+    return _rescale(matrix, a_scale + b_scale)
+
+
+def _rescale(matrix, log_scale):
+    """Divides a linear transfer matrix by its peak, moving the peak into the log2 scale"""
+    peak = matrix.max()
+    if peak == 0.0:
+        return matrix, -np.inf
+    return matrix / peak, log_scale + np.log2(peak)
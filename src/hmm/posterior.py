@@ -0,0 +1,100 @@
+import numpy as np
+
+from hmm.trellis import CHUNK_SIZE, SUM_PRODUCT, sweep
+from hmm.viterbi import index_dtype
+
+
+def forward_pass(model, sequence, out=None, chunk_size=CHUNK_SIZE):
+    """Scaled forward pass keeping every column
+
+    Returns the (T, N) normalized alpha table and the per-step normalizers
+    c_t, so that log2 P(x) = sum_t log2 c_t.
+    """
+    obs = model.encode(sequence)
+    alpha_hat = np.empty((len(obs), model.n_states)) if out is None else out
+    scales = np.empty(len(obs))
+    for _ in _forward_chunks(model, obs, alpha_hat, scales, chunk_size):
+        pass
+    return alpha_hat, scales
+
+
+def _forward_chunks(model, obs, alpha_hat, scales, chunk_size):
+    """Fills alpha_hat chunk by chunk, yielding the normalizers c_t of each chunk
+
+    With scales=None one chunk-sized buffer is reused, so only the caller
+    decides whether the O(T) normalizers are kept.
+    """
+    buffer = np.empty(min(chunk_size, len(obs))) if scales is None else None
+    alpha = None
+    for lo in range(0, len(obs), chunk_size):
+        hi = min(lo + chunk_size, len(obs))
+        block = scales[lo:hi] if buffer is None else buffer[:hi - lo]
+        alpha = sweep(SUM_PRODUCT, model, obs[None, lo:hi], alpha, out=alpha_hat[lo:hi, None], scales=block[:, None])
+        yield block
+
+    if len(obs) and block[-1] == 0.0:
+        raise ValueError("Sequence has zero probability under the model")
+
+
+def backward(model, sequence, scales, out=None, chunk_size=CHUNK_SIZE):
+    """Scaled backward pass, (T, N) beta table normalized by the forward pass's c_t"""
+    obs = model.encode(sequence)
+    beta_hat = np.empty((len(obs), model.n_states)) if out is None else out
+    for t, beta in _backward_rows(model, obs, scales, chunk_size):
+        beta_hat[t] = beta
+    return beta_hat
+
+
+def _backward_rows(model, obs, scales, chunk_size):
+    """Yields (t, beta_hat_t) from the last step to the first
+
+    beta_hat_t = A @ (e(x_t+1) * beta_hat_t+1) / c_t+1, with the same c_t as the
+    scaled forward pass, so alpha_hat_t * beta_hat_t is the posterior at t.
+    With scales=None each beta is divided by its own sum instead, so the
+    posterior is alpha_hat_t * beta_t up to a per-row constant.
+    """
+    beta = np.ones(model.n_states)
+    emission_t = model.emission.T
+    for hi in range(len(obs), 0, -chunk_size):
+        lo = max(hi - chunk_size, 0)
+        # Emission rows of the chunk plus the first row of the next chunk
+        rows = emission_t[obs[lo:hi + 1]]
+        for t in range(hi - 1, lo - 1, -1):
+            if t < len(obs) - 1:
+                beta = model.transition @ (rows[t + 1 - lo] * beta)
+                beta /= beta.sum() if scales is None else scales[t + 1]
+            yield t, beta
+
+
+def posterior_decode(model, sequence, out=None, chunk_size=CHUNK_SIZE):
+    """Per-position state posteriors from one forward and one backward sweep
+
+    Returns the (T, N) posterior matrix P(state_t | x), the maximum-posterior
+    path and the log2 likelihood. `out` may be an array to fill or a path,
+    in which case the posteriors are written to a float32 .npy memmap so
+    long sequences do not have to fit in RAM.
+    """
+    obs = model.encode(sequence)
+    if isinstance(out, (str, bytes)) or hasattr(out, "__fspath__"):
+        out = np.lib.format.open_memmap(out, mode="w+", dtype=np.float32, shape=(len(obs), model.n_states))
+
+    posterior = np.empty((len(obs), model.n_states)) if out is None else out
+
+    # The forward pass fills the posterior buffer with alpha_hat, summing the
+    # log normalizers chunk by chunk ...
+    log_likelihood = 0.0
+    for scales in _forward_chunks(model, obs, posterior, None, chunk_size):
+        with np.errstate(divide="ignore"):
+            log_likelihood += np.log2(scales).sum()
+
+    # ... and the self-normalized backward pass turns each row into the
+    # posterior in place, so no O(T) normalizers are needed
+    for t, beta in _backward_rows(model, obs, None, chunk_size):
+        row = posterior[t] * beta
+        posterior[t] = row / row.sum()
+
+    path = np.empty(len(obs), dtype=index_dtype(model.n_states))
+    for lo in range(0, len(obs), chunk_size):
+        path[lo:lo + chunk_size] = np.argmax(posterior[lo:lo + chunk_size], axis=1)
+
+    return posterior, path, log_likelihood
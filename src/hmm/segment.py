@@ -0,0 +1,105 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from hmm.trellis import MAX_PLUS, sweep
+from hmm.viterbi import index_dtype, traceback, viterbi
+
+
+def viterbi_chunked(model, sequence, chunk_size=1 << 20, overlap=1 << 12, workers=None):
+    """Viterbi segmentation of a very long sequence, chunk by chunk on every core
+
+    The sequence is cut into chunks of chunk_size symbols and each chunk is
+    decoded in a worker process together with `overlap` extra symbols on
+    both sides. Around every boundary the two neighbouring decodes then
+    cover the same 2 * overlap symbols. If they agree on any position there,
+    the paths are joined at the agreeing position closest to the boundary,
+    which gives a valid path since both continue from the same state.
+    Otherwise the region is re-decoded with its outer states fixed to the
+    neighbouring decodes (see viterbi_constrained).
+
+    Returns the path and a dict with the wall time, per-chunk lengths,
+    seconds and symbols/sec, and the number of boundary re-decodes.
+    """
+    if chunk_size <= 2 * overlap:
+        raise ValueError("chunk_size must be more than twice the overlap")
+    started = time.perf_counter()
+    obs = model.encode(sequence)
+    T = len(obs)
+    workers = workers or os.cpu_count() or 1
+
+    # Chunk starts; a short tail is merged into the previous chunk so that
+    # every chunk is longer than the two stitching regions at its ends
+    starts = list(range(0, T, chunk_size)) or [0]
+    if len(starts) > 1 and T - starts[-1] <= 2 * overlap:
+        starts.pop()
+    bounds = starts + [T]
+    windows = [(max(lo - overlap, 0), min(hi + overlap, T)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+    chunks = (obs[lo:hi] for lo, hi in windows)
+
+    if workers == 1 or len(windows) == 1:
+        results = [_decode_window(model, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_decode_window, repeat(model), chunks))
+
+    # Core of every chunk from its own decode
+    path = np.empty(T, dtype=index_dtype(model.n_states))
+    for (lo, hi), (window_lo, _), (window_path, _) in zip(zip(bounds[:-1], bounds[1:]), windows, results):
+        path[lo:hi] = window_path[lo - window_lo:hi - window_lo]
+
+    # Stitch each boundary
+    redecodes = 0
+    for i, boundary in enumerate(bounds[1:-1]):
+        lo, hi = boundary - overlap, boundary + overlap
+        left = results[i][0][lo - windows[i][0]:hi - windows[i][0]]
+        right = results[i + 1][0][lo - windows[i + 1][0]:hi - windows[i + 1][0]]
+        agree = np.flatnonzero(left == right)
+        if len(agree):
+            cut = lo + agree[np.argmin(np.abs(agree + lo - boundary))]
+            path[lo:cut + 1] = left[:cut + 1 - lo]
+            path[cut + 1:hi] = right[cut + 1 - lo:]
+        else:
+            redecodes += 1
+            before = path[lo - 1] if lo > 0 else None
+            after = path[hi] if hi < T else None
+            path[lo:hi] = viterbi_constrained(model, obs[lo:hi], before, after)
+
+    stats = {
+        "wall_time": time.perf_counter() - started,
+        "chunks": [
+            {"length": len(window_path), "seconds": seconds, "symbols_per_sec": len(window_path) / seconds}
+            for window_path, seconds in results
+        ],
+        "boundaries": len(bounds) - 2,
+        "redecodes": redecodes,
+    }
+    return path, stats
+
+
+def viterbi_constrained(model, sequence, before=None, after=None):
+    """Best path through a segment whose neighbouring states are fixed
+
+    `before` is the state right before the segment and `after` the state
+    right after it; either may be None for a segment at the start or end
+    of the sequence.
+    """
+    obs = model.encode(sequence)
+    backpointers = np.empty((len(obs), 1, model.n_states), dtype=index_dtype(model.n_states))
+    vec = None
+    if before is not None:
+        vec = np.full(model.n_states, -np.inf)
+        vec[before] = 0.0
+    delta = sweep(MAX_PLUS, model, obs[None], vec, backpointers=backpointers)[0]
+    if after is not None:
+        delta = delta + model.log_transition[:, after]
+    return traceback(backpointers[:, 0], int(np.argmax(delta)))
+
+
+def _decode_window(model, obs):
+    started = time.perf_counter()
+    path, _ = viterbi(model, obs)
+    return path, time.perf_counter() - started
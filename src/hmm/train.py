@@ -0,0 +1,134 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from hmm.model import HMM
+from hmm.posterior import _backward_rows, forward_pass
+from hmm.trellis import CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Encoded corpus held by each worker process, set once by the pool initializer
+_corpus = None
+
+
+def expected_counts(model, sequence):
+    """E-step for one sequence: expected start, transition and emission counts
+
+    Returns (start (N,), transition (N, N), emission (N, M), log2 likelihood).
+    An empty sequence contributes zero counts and a log2 likelihood of 0.0.
+    """
+    obs = model.encode(sequence)
+    if len(obs) == 0:
+        return np.zeros_like(model.start), np.zeros_like(model.transition), np.zeros_like(model.emission), 0.0
+    alpha_hat, scales = forward_pass(model, obs)
+    beta_hat = np.empty_like(alpha_hat)
+    for t, beta in _backward_rows(model, obs, scales, CHUNK_SIZE):
+        beta_hat[t] = beta
+
+    gamma = alpha_hat * beta_hat
+
+    # sum_t xi_t(i, j) = A[i, j] * sum_t alpha_hat_t(i) * e_j(x_t+1) * beta_hat_t+1(j) / c_t+1
+    weighted = model.emission.T[obs[1:]] * beta_hat[1:] / scales[1:, None]
+    transition = model.transition * (alpha_hat[:-1].T @ weighted)
+
+    n_symbols = model.emission.shape[1]
+    emission = np.stack([np.bincount(obs, weights=gamma[:, i], minlength=n_symbols) for i in range(model.n_states)])
+
+    return gamma[0], transition, emission, np.log2(scales).sum()
+
+
+def _init_worker(corpus):
+    global _corpus
+    _corpus = corpus
+
+
+def _shard_counts(model, shard, corpus=None):
+    """Sums the expected counts over the sequences of one shard"""
+    corpus = _corpus if corpus is None else corpus
+    totals = [np.zeros_like(model.start), np.zeros_like(model.transition), np.zeros_like(model.emission), 0.0]
+    for i in shard:
+        counts = expected_counts(model, corpus[i])
+        for k in range(4):
+            totals[k] += counts[k]
+    return totals
+
+
+def _make_shards(corpus, n_shards):
+    """Splits sequence indices into shards of similar total length"""
+    order = np.argsort([-len(obs) for obs in corpus], kind="stable")
+    return [order[k::n_shards].tolist() for k in range(min(n_shards, len(corpus)))]
+
+
+def _normalize(counts, fallback):
+    """Normalizes counts along the last axis, keeping the old rows that saw no counts"""
+    totals = counts.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(totals > 0, counts / totals, fallback)
+
+
+def _m_step(model, counts, pseudocount):
+    start, transition, emission = (c + pseudocount for c in counts[:3])
+    return HMM(
+        model.states, model.symbols,
+        _normalize(start, model.start),
+        _normalize(transition, model.transition),
+        _normalize(emission, model.emission),
+    )
+
+
+def baum_welch(model, sequences, n_iter=100, tol=1e-4, workers=None, pseudocount=0.0):
+    """Baum-Welch (EM) training of start, transition and emission probabilities
+
+    The corpus is encoded once and shipped to each worker process when the
+    pool starts. Every iteration only sends the current model and a list of
+    sequence indices per shard; each worker returns its summed count arrays
+    and the parent reduces them and runs the M-step. workers=1 runs the
+    E-step in-process. Stops when the log2 likelihood improves by less than
+    tol. Returns the trained model and a list of (log2 likelihood, seconds)
+    per iteration.
+    """
+    corpus = [model.encode(sequence) for sequence in sequences]
+    workers = workers or os.cpu_count() or 1
+    shards = _make_shards(corpus, workers * 4)
+    history = []
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(corpus,))
+
+    try:
+        previous = -np.inf
+        for iteration in range(1, n_iter + 1):
+            started = time.perf_counter()
+
+            # E-step, one task per shard
+            if executor is None:
+                results = (_shard_counts(model, shard, corpus) for shard in shards)
+            else:
+                results = executor.map(_shard_counts, repeat(model), shards)
+
+            totals = None
+            for counts in results:
+                totals = counts if totals is None else [total + count for total, count in zip(totals, counts)]
+
+            # M-step
+            model = _m_step(model, totals, pseudocount)
+
+            log_likelihood = totals[3]
+            elapsed = time.perf_counter() - started
+            history.append((log_likelihood, elapsed))
+            logger.info("iteration %d: log2 likelihood %.6f (%.3fs)", iteration, log_likelihood, elapsed)
+
+            if log_likelihood - previous < tol:
+                break
+            previous = log_likelihood
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return model, history
@@ -0,0 +1,287 @@
+import numpy as np
+
+# Columns processed per emission gather by the long-sequence sweeps
+CHUNK_SIZE = 1 << 16
+
+# Largest block (in elements) whose emission rows sweep() gathers in one go
+GATHER_LIMIT = 1 << 22
+
+
+class Semiring:
+    """(plus, times) pair driving the trellis recursion
+
+    vec_t[j] = plus_k(vec_t-1[k] times A[k, j]) times e_j(x_t)
+
+    parameters() lifts the model into the representation matvec() expects,
+    so each semiring is free to keep the transition matrix in whatever form
+    makes its step cheapest.
+    """
+
+    name = None
+    log = False
+
+    def parameters(self, model, dtype=None):
+        """(start, transition, emission rows indexed by symbol) in this semiring"""
+        start, emission_t = self._start_emission(model, dtype)
+        transition = model.log_transition if self.log else model.transition
+        if dtype is not None:
+            transition = transition.astype(dtype, copy=False)
+        return start, transition, emission_t
+
+    def _start_emission(self, model, dtype=None):
+        # Subclasses with their own transition form use only these, so a
+        # sparse model's dense transition is never built for them
+        if self.log:
+            arrays = (model.log_start, model.log_emission.T)
+        else:
+            arrays = (model.start, model.emission.T)
+        if dtype is not None:
+            arrays = tuple(a.astype(dtype, copy=False) for a in arrays)
+        return arrays
+
+    def times(self, a, b):
+        return a + b if self.log else a * b
+
+    def identity(self, n):
+        """n x n identity matrix of the semiring"""
+        if not self.log:
+            return np.eye(n)
+        matrix = np.full((n, n), -np.inf)
+        np.fill_diagonal(matrix, 0.0)
+        return matrix
+
+    def matvec(self, vec, transition):
+        raise NotImplementedError
+
+    def matmul(self, a, b):
+        raise NotImplementedError
+
+    def total(self, vec):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<Semiring {self.name}>"
+
+
+class SumProduct(Semiring):
+    """(+, x) on probabilities: forward algorithm"""
+
+    name = "sum-product"
+
+    def matvec(self, vec, transition):
+        return vec @ transition
+
+    def matmul(self, a, b):
+        return a @ b
+
+    def total(self, vec):
+        return vec.sum(axis=-1)
+
+
+class LogSumProduct(Semiring):
+    """(logsumexp, +) on log2 probabilities: forward algorithm in log space"""
+
+    name = "log-sum-product"
+    log = True
+
+    def parameters(self, model, dtype=None):
+        # The transition stays linear: the step shifts vec by its peak, leaves
+        # log space for one matmul and comes back, which cannot underflow
+        start, emission_t = self._start_emission(model, dtype)
+        transition = model.transition if dtype is None else model.transition.astype(dtype, copy=False)
+        return start, transition, emission_t
+
+    def matvec(self, vec, transition):
+        if vec.ndim == 1:
+            peak = vec.max()
+            peak = 0.0 if peak == -np.inf else peak
+        else:
+            peak = np.max(vec, axis=-1, keepdims=True)
+            # Rows that are already impossible: shift by 0 so they stay at -inf
+            peak[peak == -np.inf] = 0.0
+        with np.errstate(divide="ignore"):
+            return np.log2(np.exp2(vec - peak) @ transition) + peak
+
+    def total(self, vec):
+        return logsumexp2(vec, axis=-1)
+
+
+class MaxPlus(Semiring):
+    """(max, +) on log2 probabilities: Viterbi algorithm"""
+
+    name = "max-plus"
+    log = True
+
+    def matvec(self, vec, transition):
+        return np.max(vec[..., :, None] + transition, axis=-2)
+
+    def argmatvec(self, vec, transition):
+        """matvec together with the maximizing previous state of every entry"""
+        scores = vec[..., :, None] + transition
+        best = np.argmax(scores, axis=-2)
+        if vec.ndim == 1:
+            return scores[best, np.arange(len(best))], best
+        return np.take_along_axis(scores, best[..., None, :], axis=-2)[..., 0, :], best
+
+    def matmul(self, a, b):
+        return np.max(a[:, :, None] + b[None, :, :], axis=1)
+
+    def total(self, vec):
+        return np.max(vec, axis=-1)
+
+
+class SparseSumProduct(SumProduct):
+    """Sum-product with the transition kept in CSR form: O(nnz) per step"""
+
+    name = "sparse-sum-product"
+
+    def parameters(self, model, dtype=None):
+        start, emission_t = self._start_emission(model, dtype)
+        transition_t = model.sparse_transition()
+        if dtype is not None:
+            transition_t = transition_t.astype(dtype)
+        return start, transition_t, emission_t
+
+    def matvec(self, vec, transition_t):
+        return transition_t @ vec if vec.ndim == 1 else (transition_t @ vec.T).T
+
+    def matmul(self, a, b):
+        raise NotImplementedError("Sparse semirings only step vectors")
+
+
+class SparseMaxPlus(MaxPlus):
+    """Max-plus as a segment max over the incoming edges of each state: O(nnz) per step"""
+
+    name = "sparse-max-plus"
+
+    def parameters(self, model, dtype=None):
+        start, emission_t = self._start_emission(model, dtype)
+        indptr, previous, log_weights = model.predecessors()
+        if dtype is not None:
+            log_weights = log_weights.astype(dtype)
+        # reduceat needs in-range segment starts; states without predecessors are masked afterwards
+        starts = np.minimum(indptr[:-1], max(len(previous) - 1, 0))
+        empty = indptr[:-1] == indptr[1:]
+        return start, (previous, log_weights, starts, empty, np.diff(indptr)), emission_t
+
+    def _segment_max(self, vec, transition):
+        previous, log_weights, starts, empty, _ = transition
+        scores = vec[..., previous] + log_weights
+        best = np.maximum.reduceat(scores, starts, axis=-1)
+        best[..., empty] = -np.inf
+        return scores, best
+
+    def matvec(self, vec, transition):
+        return self._segment_max(vec, transition)[1]
+
+    def argmatvec(self, vec, transition):
+        """Segment max plus its first maximizing edge, i.e. the lowest previous state as in MaxPlus"""
+        previous, _, starts, empty, counts = transition
+        scores, best = self._segment_max(vec, transition)
+        edges = np.arange(len(previous))
+        hits = np.where(scores == np.repeat(best, counts, axis=-1), edges, len(previous))
+        first = np.minimum.reduceat(hits, starts, axis=-1)
+        back = previous[np.minimum(first, len(previous) - 1)]
+        back[..., empty] = 0
+        return best, back
+
+    def matmul(self, a, b):
+        raise NotImplementedError("Sparse semirings only step vectors")
+
+
+SUM_PRODUCT = SumProduct()
+LOG_SUM_PRODUCT = LogSumProduct()
+MAX_PLUS = MaxPlus()
+SPARSE_SUM_PRODUCT = SparseSumProduct()
+SPARSE_MAX_PLUS = SparseMaxPlus()
+
+
+def sweep(semiring, model, obs, vec=None, active=None, out=None, backpointers=None, scales=None, dtype=None):
+    """Advances a (B, N) trellis block over the columns of obs (B, T)
+
+    This is the one recursion behind forward, log-forward and Viterbi, for
+    single sequences (B = 1) and batches alike.
+
+    vec=None starts from the start distribution at column 0; otherwise the
+    sweep continues from vec, so long inputs can be fed chunk by chunk.
+    active[t] is the number of leading rows still running at column t (rows
+    sorted by length); None means all of them. Optional outputs, indexed by
+    column: out[t] receives the block, backpointers[t] the maximizing
+    previous states (max-plus only) and scales[t] the per-row normalizers
+    (sum-product only; the block is then renormalized to sum to 1 each step).
+    Returns the block after the last column.
+    """
+    start, transition, emission_t = semiring.parameters(model, dtype)
+    B, T = obs.shape
+    if vec is not None:
+        vec = np.array(vec, dtype=start.dtype, ndmin=2)
+    if B == 1 and active is None:
+        return _sweep_single(semiring, start, transition, emission_t, obs[0], vec, out, backpointers, scales)
+
+    # Gather the emission rows of the whole block up front when they are small enough
+    emissions = emission_t[obs] if obs.size * len(start) <= GATHER_LIMIT else None
+    tiny = np.finfo(start.dtype).tiny
+
+    for t in range(T):
+        b = B if active is None else active[t]
+        rows = emissions[:b, t] if emissions is not None else emission_t[obs[:b, t]]
+        if vec is None:
+            # Initialization
+            vec = semiring.times(start, emission_t[obs[:, t]])
+            current = vec[:b]
+        elif backpointers is not None:
+            current = vec if b == B else vec[:b]
+            step, backpointers[t, :b] = semiring.argmatvec(current, transition)
+            current[...] = semiring.times(step, rows)
+        else:
+            current = vec if b == B else vec[:b]
+            current[...] = semiring.times(semiring.matvec(current, transition), rows)
+
+        if scales is not None:
+            norm = current.sum(axis=1)
+            scales[t, :b] = norm
+            # Rows of impossible sequences stay at zero, as do their later normalizers
+            current /= np.maximum(norm, tiny)[:, None]
+        if out is not None:
+            out[t, :b] = current
+
+    return vec
+
+
+def _sweep_single(semiring, start, transition, emission_t, obs, vec, out, backpointers, scales):
+    """sweep() for one sequence, on a 1-D vector to keep the per-step overhead low"""
+    vec = None if vec is None else vec[0]
+    emissions = emission_t[obs]
+
+    for t in range(len(obs)):
+        if vec is None:
+            vec = semiring.times(start, emissions[t])
+        elif backpointers is not None:
+            vec, backpointers[t, 0] = semiring.argmatvec(vec, transition)
+            vec = semiring.times(vec, emissions[t])
+        else:
+            vec = semiring.times(semiring.matvec(vec, transition), emissions[t])
+
+        if scales is not None:
+            norm = vec.sum()
+            scales[t, 0] = norm
+            if norm > 0:
+                vec /= norm
+        if out is not None:
+            out[t, 0] = vec
+
+    return None if vec is None else vec[None]
+
+
+def active_rows(lengths, width):
+    """Number of rows still running at each column, for length-sorted (descending) rows"""
+    return np.count_nonzero(lengths[:, None] > np.arange(width), axis=0)
+
+
+def logsumexp2(x, axis=None):
+    """log2(sum(2 ** x)) computed without underflow"""
+    peak = np.max(x, axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0.0)
+    with np.errstate(divide="ignore"):
+        total = np.log2(np.sum(np.exp2(x - peak), axis=axis, keepdims=True)) + peak
+    return np.squeeze(total, axis=axis) if axis is not None else total.item()
@@ -0,0 +1,163 @@
+import math
+
+import numpy as np
+
+from hmm.trellis import CHUNK_SIZE, MAX_PLUS, SPARSE_MAX_PLUS, active_rows, sweep
+
+
+def index_dtype(n):
+    """Smallest unsigned integer dtype that holds the indices 0..n-1"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def viterbi(model, sequence, chunk_size=CHUNK_SIZE, memory_budget=None, sparse=False):
+    """Most likely state path (array of state indices) and its log2 score
+
+    Only two delta columns are kept; the traceback is stored as a (T, N)
+    backpointer table in the smallest unsigned dtype that fits N, i.e. one
+    byte per entry for up to 256 states. If that table would exceed
+    memory_budget bytes, the checkpointed O(N * sqrt(T)) mode is used instead.
+    sparse=True takes each max over the incoming transitions of a state only,
+    O(nnz) per step instead of O(N^2); ties still go to the lowest state.
+    """
+    obs = model.encode(sequence)
+    dtype = index_dtype(model.n_states)
+    if len(obs) == 0:
+        return np.empty(0, dtype=dtype), 0.0
+    if memory_budget is not None and len(obs) * model.n_states * np.dtype(dtype).itemsize > memory_budget:
+        return viterbi_checkpointed(model, obs, sparse=sparse)
+
+    backpointers = np.empty((len(obs), model.n_states), dtype=dtype)
+    delta = None
+
+    for lo in range(0, len(obs), chunk_size):
+        hi = lo + chunk_size
+        delta = sweep(_semiring(sparse), model, obs[None, lo:hi], delta, backpointers=backpointers[lo:hi, None])
+
+    last = int(np.argmax(delta[0]))
+    return traceback(backpointers, last), delta[0, last]
+
+
+def viterbi_checkpointed(model, sequence, checkpoint_every=None, sparse=False):
+    """Viterbi in O(N * sqrt(T)) memory by recomputing segments during traceback
+
+    The forward sweep keeps delta only at every k-th column (k = ceil(sqrt(T))
+    by default). The traceback then walks the segments from last to first,
+    recomputing each one from its checkpoint with a k-row backpointer buffer.
+    Every column is computed twice; the path is the same as viterbi().
+    """
+    obs = model.encode(sequence)
+    semiring = _semiring(sparse)
+    T, N = len(obs), model.n_states
+    if T == 0:
+        return np.empty(0, dtype=index_dtype(N)), 0.0
+    k = checkpoint_every or max(1, math.isqrt(T - 1) + 1)
+    starts = range(0, T, k)
+    checkpoints = np.empty((len(starts), N))
+    backpointers = np.empty((k, 1, N), dtype=index_dtype(N))
+
+    # Forward sweep, keeping delta at the first column of each segment
+    delta = None
+    for j, lo in enumerate(starts):
+        hi = min(lo + k, T)
+        delta = sweep(semiring, model, obs[None, lo:lo + 1], delta, backpointers=backpointers)
+        checkpoints[j] = delta[0]
+        delta = sweep(semiring, model, obs[None, lo + 1:hi], delta, backpointers=backpointers[1:])
+
+    path = np.empty(T, dtype=backpointers.dtype)
+    state = int(np.argmax(delta[0]))
+    score = delta[0, state]
+
+    # Traceback, recomputing each segment's backpointers from its checkpoint
+    for j in range(len(starts) - 1, -1, -1):
+        lo, hi = starts[j], min(starts[j] + k, T)
+        delta = sweep(semiring, model, obs[None, lo + 1:hi], checkpoints[j], backpointers=backpointers[1:])
+        if hi < T:
+            # Step from the last column of this segment into the decoded state at column hi
+            state = int(np.argmax(delta[0] + model.log_transition_into(path[hi])))
+        for t in range(hi - 1, lo, -1):
+            path[t] = state
+            state = backpointers[t - lo, 0, state]
+        path[lo] = state
+
+    return path, score
+
+
+def traceback(backpointers, last):
+    """Follows backpointers[t][state] from the final state back to t = 0"""
+    path = np.empty(len(backpointers), dtype=backpointers.dtype)
+    state = last
+    for t in range(len(backpointers) - 1, -1, -1):
+        path[t] = state
+        state = backpointers[t, state]
+    return path
+
+
+def viterbi_trellis(model, sequence):
+    """Full (N, T) table of best log2 path scores and the Viterbi path, from one sweep
+
+    Used by the scripts that print the table.
+    """
+    obs = model.encode(sequence)
+    dtype = index_dtype(model.n_states)
+    delta = np.full((len(obs), 1, model.n_states), -np.inf)
+    backpointers = np.empty((len(obs), 1, model.n_states), dtype=dtype)
+    sweep(MAX_PLUS, model, obs[None], out=delta, backpointers=backpointers)
+    if len(obs) == 0:
+        return delta[:, 0].T, np.empty(0, dtype=dtype)
+    return delta[:, 0].T, traceback(backpointers[:, 0], int(np.argmax(delta[-1, 0])))
+
+
+def viterbi_batch(model, sequences, batch_size=4096, sparse=False):
+    """Viterbi paths and log2 scores of many sequences at once
+
+    The max-plus recursion runs on a (B, N) delta block per time step.
+    Like forward_batch, each block is sorted by length so the rows still
+    running at step t are a prefix and the length mask reduces to a slice.
+    Returns a list of paths (state index arrays) and an array of scores.
+    """
+    sequences = list(sequences)
+    paths = [None] * len(sequences)
+    scores = np.empty(len(sequences))
+    dtype = index_dtype(model.n_states)
+
+    for lo in range(0, len(sequences), batch_size):
+        obs, lengths = model.encode_batch(sequences[lo:lo + batch_size])
+        order = np.argsort(-lengths, kind="stable")
+        obs, lengths = obs[order], lengths[order]
+        B, T = obs.shape
+        active = active_rows(lengths, T)
+
+        backpointers = np.empty((T, B, model.n_states), dtype=dtype)
+        delta = sweep(_semiring(sparse), model, obs, active=active, backpointers=backpointers)
+        if delta is None:
+            # Every read in the block is empty
+            for i in range(B):
+                paths[lo + i] = np.empty(0, dtype=dtype)
+            scores[lo:lo + B] = 0.0
+            continue
+
+        # Traceback of the whole block, one column at a time
+        state = np.argmax(delta, axis=1)
+        block_scores = delta[np.arange(B), state]
+        # Empty reads only saw padding; their path is empty and scores log2(1)
+        block_scores[lengths == 0] = 0.0
+        block_paths = np.zeros((B, T), dtype=dtype)
+        for t in range(T - 1, 0, -1):
+            b = active[t]
+            block_paths[:b, t] = state[:b]
+            state[:b] = backpointers[t, np.arange(b), state[:b]]
+        block_paths[:, 0] = state
+
+        for row, i in enumerate(order):
+            paths[lo + i] = block_paths[row, :lengths[row]]
+            scores[lo + i] = block_scores[row]
+
+    return paths, scores
+
+
+def _semiring(sparse):
+    return SPARSE_MAX_PLUS if sparse else MAX_PLUS
@@ -0,0 +1,151 @@
+import time
+
+import numpy as np
+
+
+class CompiledMDP:
+    """MDP with states and actions interned to integer ids
+
+    transition is either an (A, S, S) array with transition[a, s, s'] =
+    P(s' | s, a), or (sparse) a list of A scipy CSR matrices of shape (S, S),
+    whose memory grows with the number of nonzero transitions only.
+    rewards is an (S,) vector. valid[a, s] marks the actions available in
+    state s; states without any action are terminal and keep their reward.
+    """
+
+    def __init__(self, states, actions, transition, rewards, valid):
+        # A range stays a range, so million-state MDPs built from arrays need no name list
+        self.states = states if isinstance(states, range) else list(states)
+        self.actions = list(actions)
+        self.transition = transition
+        self.sparse = isinstance(transition, list)
+        self.rewards = rewards
+        self.valid = valid
+        self.terminal = ~valid.any(axis=0)
+
+    @property
+    def n_states(self):
+        return len(self.states)
+
+    @property
+    def n_actions(self):
+        return len(self.actions)
+
+    def expected(self, values):
+        """(A, S) expected next-state value of every action in every state"""
+        if self.sparse:
+            return np.stack([matrix @ values for matrix in self.transition])
+        return self.transition @ values
+
+    def to_dict(self, values):
+        return {state: float(value) for state, value in zip(self.states, values)}
+
+
+def compile_mdp(transition, rewards, sparse=False, dtype=np.float64):
+    """Interns the nested transition[state][action][next_state] dicts into a CompiledMDP
+
+    States are numbered in order of first appearance as a source state, a
+    next state or a reward key; actions in order of first appearance.
+    """
+    states, actions, triplets = _triplets(transition, rewards)
+    reward_vector = [rewards.get(state, 0.0) for state in states]
+    return from_triplets(states, actions, *triplets, reward_vector, sparse=sparse, dtype=dtype)
+
+
+def from_triplets(states, actions, action, state, next_state, probability, rewards, sparse=False, dtype=np.float64):
+    """Builds a CompiledMDP straight from transition arrays, without any dicts
+
+    states and actions are the id -> name lists (or just their counts);
+    the four arrays list every (a, s, s', P(s' | s, a)), and duplicate
+    entries are summed. With sparse=True each action gets a scipy CSR
+    matrix and no S x S array is ever allocated.
+    """
+    states = range(states) if isinstance(states, int) else states
+    actions = range(actions) if isinstance(actions, int) else actions
+    S, A = len(states), len(actions)
+    action, state, next_state = (np.asarray(a, dtype=np.intp) for a in (action, state, next_state))
+    probability = np.asarray(probability, dtype=dtype)
+
+    if sparse:
+        from scipy import sparse as scipy_sparse
+
+        transition = []
+        for a in range(A):
+            rows = action == a
+            transition.append(
+                scipy_sparse.csr_matrix((probability[rows], (state[rows], next_state[rows])), shape=(S, S))
+            )
+    else:
+        transition = np.zeros((A, S, S), dtype=dtype)
+        np.add.at(transition, (action, state, next_state), probability)
+
+    valid = np.zeros((A, S), dtype=bool)
+    valid[action, state] = True
+    return CompiledMDP(states, actions, transition, np.asarray(rewards, dtype=dtype), valid)
+
+
+def _triplets(transition, rewards):
+    """Interned states and actions plus (action, state, next state, probability) arrays"""
+    states = {}
+    actions = {}
+    a, s, t, p = [], [], [], []
+    for state in transition:
+        states.setdefault(state, len(states))
+    for state, by_action in transition.items():
+        for action, outcomes in by_action.items():
+            action_id = actions.setdefault(action, len(actions))
+            for next_state, probability in outcomes.items():
+                a.append(action_id)
+                s.append(states[state])
+                t.append(states.setdefault(next_state, len(states)))
+                p.append(probability)
+    for state in rewards:
+        states.setdefault(state, len(states))
+    arrays = (np.array(a, dtype=np.intp), np.array(s, dtype=np.intp), np.array(t, dtype=np.intp), np.array(p))
+    return list(states), list(actions), arrays
+
+
+def bellman_backup(mdp, values, discount_factor):
+    """One Jacobi backup V'(s) = R(s) + discount * max_a sum_s' P(s' | s, a) V(s')
+
+    Returns the new values and the greedy action of every state (-1 for
+    terminal states).
+    """
+    q = mdp.expected(values)
+    q[~mdp.valid] = -np.inf
+    policy = np.argmax(q, axis=0)
+    best = q[policy, np.arange(mdp.n_states)]
+    best[mdp.terminal] = 0.0
+    policy[mdp.terminal] = -1
+    return mdp.rewards + discount_factor * best, policy
+
+
+def value_iteration(mdp, discount_factor=0.9, iterations=1000, threshold=1e-6, values=None):
+    """Value iteration on a compiled MDP, one vectorized backup per sweep
+
+    Starts from `values` (the rewards by default) and stops once no value
+    changes by threshold or more, or after `iterations` sweeps. Returns the
+    values, the greedy policy and a stats dict with the number of sweeps
+    and backups, the final residual and the wall time.
+    """
+    started = time.perf_counter()
+    values = mdp.rewards.copy() if values is None else np.asarray(values, dtype=mdp.rewards.dtype)
+    policy = np.full(mdp.n_states, -1)
+    residual = np.inf
+    sweeps = 0
+
+    while sweeps < iterations:
+        new_values, policy = bellman_backup(mdp, values, discount_factor)
+        residual = np.max(np.abs(new_values - values), initial=0.0)
+        values = new_values
+        sweeps += 1
+        if residual < threshold:
+            break
+
+    stats = {
+        "iterations": sweeps,
+        "backups": sweeps * mdp.n_states,
+        "residual": float(residual),
+        "seconds": time.perf_counter() - started,
+    }
+    return values, policy, stats
@@ -1,11 +1,26 @@
 import math
 
-
-def value_iteration(transition, rewards, discount_factor=0.9, iterations=5, threshold=0.5):
-
+# Vectorized Bellman value iteration on the compiled MDP (see mdp.compiled and mdp.sweeping):
+#   "dense"        - (A, S, S) transition tensor, one batched matmul per sweep
+#   "sparse"       - one scipy CSR matrix per action, memory O(nonzero transitions)
+#   "gauss-seidel" - sparse, in-place sweeps that reuse values updated earlier in the sweep
+#   "prioritized"  - sparse, backs up one state at a time in order of Bellman residual;
+#                    `iterations` caps the backups at that many sweeps' worth
+#   "parallel"     - sparse, sweeps split across one worker process per core (see mdp.parallel)
+BACKENDS = ("dense", "sparse", "gauss-seidel", "prioritized", "parallel")
+
+
+def value_iteration(transition, rewards, discount_factor=0.9, iterations=5, threshold=0.5, report=False):
+    """Value iteration over the nested transition[state][action][next_state] dicts
+
+    Every sweep adds the discounted best expected value to each state's
+    current value. This is not the standard Bellman backup; for that, see
+    compiled_value_iteration.
+    """
     new_rewards = {}
 
-    print("Initial Rewards:", rewards)
+    if report:
+        print("Initial Rewards:", rewards)
 
     for _ in range(iterations):
 
@@ -29,20 +44,67 @@ def value_iteration(transition, rewards, discount_factor=0.9, iterations=5, thre
         rewards = new_rewards.copy()
         new_rewards = {}
 
-        print("Updated Rewards:", rewards)
+        if report:
+            print("Updated Rewards:", rewards)
 
     return rewards
 
 
-transitions = {
-    'pu': {'s': {'pu': 1}, 'a': {'pu': 0.5, 'pf': 0.5}},
-    'pf': {'s': {'rf': 0.5, 'pu': 0.5}, 'a': {'pf': 1}},
-    'rf': {'s': {'rf': 0.5, 'ru': 0.5}, 'a': {'pf': 1}},
-    'ru': {'s': {'ru': 0.5, 'pu': 0.5}, 'a': {'pu': 0.5, 'pf': 0.5}}
-}
+def compiled_value_iteration(
+    transition, rewards, discount_factor=0.9, iterations=1000, threshold=1e-6, report=False, backend="dense"
+):
+    """Bellman value iteration over the nested transition[state][action][next_state] dicts
+
+    Compiles the dicts to arrays and iterates
+    V(s) = R(s) + discount * max_a sum_s' P(s' | s, a) V(s'), with `rewards`
+    as the fixed R, until no value changes by threshold or more. Every
+    backend converges to the same fixed point and only differs in speed
+    and memory; see BACKENDS. Returns a value dict.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    from mdp import compiled
+
+    if report:
+        print("Initial Rewards:", rewards)
+
+    model = compiled.compile_mdp(transition, rewards, sparse=backend != "dense")
+    if backend == "gauss-seidel":
+        from mdp import sweeping
+
+        values, _, stats = sweeping.gauss_seidel(model, discount_factor, iterations, threshold)
+    elif backend == "prioritized":
+        from mdp import sweeping
+
+        values, _, stats = sweeping.prioritized_sweeping(
+            model, discount_factor, iterations * model.n_states, threshold
+        )
+    elif backend == "parallel":
+        from mdp import parallel
+
+        values, _, stats = parallel.value_iteration(model, discount_factor, iterations, threshold)
+    else:
+        values, _, stats = compiled.value_iteration(model, discount_factor, iterations, threshold)
+
+    if report:
+        print(f"Sweeps: {stats['iterations']}, backups: {stats['backups']}, max residual: {stats['residual']:.6g}")
+    return model.to_dict(values)
+
+
+def main():
+    transitions = {
+        'pu': {'s': {'pu': 1}, 'a': {'pu': 0.5, 'pf': 0.5}},
+        'pf': {'s': {'rf': 0.5, 'pu': 0.5}, 'a': {'pf': 1}},
+        'rf': {'s': {'rf': 0.5, 'ru': 0.5}, 'a': {'pf': 1}},
+        'ru': {'s': {'ru': 0.5, 'pu': 0.5}, 'a': {'pu': 0.5, 'pf': 0.5}}
+    }
+
+    rewards = {'pu': 0, 'pf': 0, 'ru': 10, 'rf': 10}
+
+    optimal_values = value_iteration(transitions, rewards, report=True)
 
-rewards = {'pu': 0, 'pf': 0, 'ru': 10, 'rf': 10}
+    print("\nFinal Optimal Values:", optimal_values)
 
-optimal_values = value_iteration(transitions, rewards)
 
-print("\nFinal Optimal Values:", optimal_values)
+if __name__ == "__main__":
+    main()
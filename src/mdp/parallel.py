@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import numpy as np
+
+from mdp.sweeping import _block_backup, stacked_transition
+
+
+def partition(mdp, workers):
+    """Splits the states into `workers` contiguous slices with about the same number of transitions each"""
+    if mdp.sparse:
+        indptr = stacked_transition(mdp).indptr
+        per_state = np.diff(indptr[::mdp.n_actions])
+    else:
+        per_state = np.ones(mdp.n_states)
+    cumulative = np.cumsum(per_state)
+    targets = cumulative[-1] * np.arange(1, workers) / workers
+    bounds = np.searchsorted(cumulative, targets, side="right")
+    return [int(b) for b in np.concatenate(([0], bounds, [mdp.n_states]))]
+
+
+class _Shared:
+    """numpy array in a named shared memory block, created by the parent and attached by workers"""
+
+    def __init__(self, shape, dtype, name=None):
+        self.shape, self.dtype = shape, np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * self.dtype.itemsize)
+        self.memory = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self.array = np.ndarray(shape, dtype=self.dtype, buffer=self.memory.buf)
+
+    def __reduce__(self):
+        # Workers attach by name instead of receiving a copy
+        return _Shared, (self.shape, self.dtype, self.memory.name)
+
+    def close(self):
+        del self.array
+        self.memory.close()
+
+
+def _worker(index, rows, start, stop, values, residuals, policy, sweeps, barrier, discount_factor, iterations, threshold):
+    """Backs up states [start, stop) every sweep until the global residual drops below threshold"""
+    block, invalid, terminal, rewards = rows
+    current = 0
+    try:
+        for sweep in range(iterations):
+            new_values, policy.array[start:stop] = _block_backup(
+                block, invalid, terminal, rewards, values.array[current], discount_factor
+            )
+            # Residuals alternate between two rows, so a worker already in the
+            # next sweep cannot overwrite one that a slower worker still reads
+            change = np.abs(new_values - values.array[current, start:stop])
+            residuals.array[sweep % 2, index] = np.max(change, initial=0.0)
+            values.array[1 - current, start:stop] = new_values
+            barrier.wait()
+
+            current = 1 - current
+            if index == 0:
+                sweeps.array[0] = sweep + 1
+            if residuals.array[sweep % 2].max() < threshold:
+                break
+    except threading.BrokenBarrierError:
+        pass  # another worker died; the parent reports it
+    finally:
+        for shared in (values, residuals, policy, sweeps):
+            shared.close()
+
+
+def value_iteration(mdp, discount_factor=0.9, iterations=1000, threshold=1e-6, workers=None, values=None):
+    """Value iteration with the states split across worker processes
+
+    The value vector lives in shared memory, double buffered: every sweep
+    each worker backs up its own slice of states from one buffer into the
+    other, then all of them meet at a barrier and read the global max
+    residual from a shared array, so they stop on the same sweep. Each
+    worker gets its transition rows once, when it starts. The result is the
+    same as compiled.value_iteration; the stats dict also has the number of
+    workers.
+    """
+    started = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, mdp.n_states)
+    bounds = partition(mdp, workers)
+    stacked = stacked_transition(mdp)
+    invalid = ~mdp.valid.T
+    A = mdp.n_actions
+
+    shared_values = _Shared((2, mdp.n_states), mdp.rewards.dtype)
+    residuals = _Shared((2, workers), np.float64)
+    policy = _Shared((mdp.n_states,), np.intp)
+    sweeps = _Shared((1,), np.int64)
+    shared_values.array[0] = mdp.rewards if values is None else values
+    residuals.array[:] = np.inf
+    policy.array[:] = -1
+    sweeps.array[0] = 0
+
+    context = multiprocessing.get_context()
+    barrier = context.Barrier(workers)
+    processes = []
+    try:
+        for index, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+            rows = (stacked[start * A:stop * A], invalid[start:stop], mdp.terminal[start:stop], mdp.rewards[start:stop])
+            process = context.Process(
+                target=_worker,
+                args=(index, rows, start, stop, shared_values, residuals, policy, sweeps, barrier,
+                      discount_factor, iterations, threshold),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+
+        # A worker that dies would leave the others waiting at the barrier forever
+        running = {process.sentinel: process for process in processes}
+        while running:
+            for sentinel in wait(list(running)):
+                process = running.pop(sentinel)
+                process.join()
+                if process.exitcode != 0:
+                    barrier.abort()
+        failed = [process.exitcode for process in processes if process.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {workers} value iteration workers failed (exit codes {failed})")
+
+        done = int(sweeps.array[0])
+        result = shared_values.array[done % 2].copy()
+        stats = {
+            "iterations": done,
+            "backups": done * mdp.n_states,
+            "residual": float(residuals.array[(done - 1) % 2].max()) if done else float("inf"),
+            "seconds": time.perf_counter() - started,
+            "workers": workers,
+        }
+        return result, policy.array.copy(), stats
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for shared in (shared_values, residuals, policy, sweeps):
+            shared.close()
+            shared.memory.unlink()
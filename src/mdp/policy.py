@@ -0,0 +1,137 @@
+import time
+
+import numpy as np
+
+from mdp.compiled import bellman_backup
+
+
+def policy_matrix(mdp, policy):
+    """S x S transition matrix of a deterministic policy (zero rows for terminal states)"""
+    if not mdp.sparse:
+        matrix = mdp.transition[np.maximum(policy, 0), np.arange(mdp.n_states)]
+        matrix[policy < 0] = 0.0
+        return matrix
+
+    from scipy import sparse
+
+    matrix = None
+    for a, action_matrix in enumerate(mdp.transition):
+        rows = sparse.diags((policy == a).astype(action_matrix.dtype)) @ action_matrix
+        matrix = rows if matrix is None else matrix + rows
+    return matrix.tocsr()
+
+
+SOLVERS = ("iterative", "direct")
+
+
+def evaluate_policy(mdp, policy, discount_factor, solver="iterative", tolerance=1e-12):
+    """Exact values of a policy: solves (I - discount * P_pi) V = R
+
+    Dense MDPs go through numpy. Sparse ones are never densified: "iterative"
+    runs BiCGSTAB from scipy to a relative residual of `tolerance`, falling
+    back to the sparse LU solver if it does not converge; "direct" always
+    uses the LU solver, whose fill-in makes it slow on random transition
+    graphs with more than a few thousand states.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+    matrix = policy_matrix(mdp, policy)
+    if not mdp.sparse:
+        return np.linalg.solve(np.eye(mdp.n_states) - discount_factor * matrix, mdp.rewards)
+
+    from scipy import sparse
+    from scipy.sparse.linalg import bicgstab, spsolve
+
+    system = sparse.identity(mdp.n_states, dtype=matrix.dtype, format="csr") - discount_factor * matrix
+    if solver == "iterative":
+        values, info = bicgstab(system, mdp.rewards, rtol=tolerance, atol=0.0, maxiter=10 * mdp.n_states)
+        if info == 0:
+            return values
+    return spsolve(system.tocsc(), mdp.rewards)
+
+
+def improve_policy(mdp, values, discount_factor, policy=None):
+    """Greedy policy for `values`, keeping the current action wherever it is still (near) best
+
+    Keeping tied actions stops policy iteration from cycling between
+    equally good policies.
+    """
+    q = mdp.expected(values)
+    q[~mdp.valid] = -np.inf
+    best = np.argmax(q, axis=0)
+    columns = np.arange(mdp.n_states)
+    if policy is not None:
+        current = np.maximum(policy, 0)
+        tolerance = 1e-12 * np.maximum(np.abs(q[best, columns]), 1.0)
+        best = np.where(q[current, columns] >= q[best, columns] - tolerance, current, best)
+    best[mdp.terminal] = -1
+    return best
+
+
+def policy_iteration(mdp, discount_factor=0.9, iterations=1000, policy=None, solver="iterative"):
+    """Policy iteration with exact policy evaluation
+
+    Alternates a linear solve for the values of the current policy with a
+    greedy improvement step, until the policy stops changing. Starts from
+    `policy` or the greedy policy for the rewards; `solver` is passed to
+    evaluate_policy. Returns the values, the policy and a stats dict
+    (iterations, backups, seconds).
+    """
+    started = time.perf_counter()
+    if policy is None:
+        policy = improve_policy(mdp, mdp.rewards, discount_factor)
+
+    rounds = 0
+    while rounds < iterations:
+        values = evaluate_policy(mdp, policy, discount_factor, solver)
+        improved = improve_policy(mdp, values, discount_factor, policy)
+        rounds += 1
+        if np.array_equal(improved, policy):
+            break
+        policy = improved
+
+    stats = {
+        "iterations": rounds,
+        "backups": rounds * mdp.n_states,
+        "seconds": time.perf_counter() - started,
+    }
+    return values, policy, stats
+
+
+def modified_policy_iteration(mdp, discount_factor=0.9, k=10, iterations=1000, threshold=1e-6):
+    """Modified policy iteration: k partial evaluation sweeps per improvement
+
+    Each round does one full Bellman backup, which yields the greedy policy
+    and the residual, then k sweeps V = R + discount * P_pi V under that
+    policy. k=0 is value iteration; a large k approaches policy iteration.
+    Stops once the Bellman residual drops below threshold. The stats count
+    both kinds of sweep as backups.
+    """
+    started = time.perf_counter()
+    values = mdp.rewards.copy()
+    residual = np.inf
+    rounds = 0
+    evaluation_sweeps = 0
+
+    while rounds < iterations:
+        new_values, policy = bellman_backup(mdp, values, discount_factor)
+        residual = np.max(np.abs(new_values - values), initial=0.0)
+        values = new_values
+        rounds += 1
+        if residual < threshold:
+            break
+
+        # Partial evaluation of the greedy policy
+        matrix = policy_matrix(mdp, policy)
+        for _ in range(k):
+            values = mdp.rewards + discount_factor * (matrix @ values)
+        evaluation_sweeps += k
+
+    stats = {
+        "iterations": rounds,
+        "evaluation_sweeps": evaluation_sweeps,
+        "backups": (rounds + evaluation_sweeps) * mdp.n_states,
+        "residual": float(residual),
+        "seconds": time.perf_counter() - started,
+    }
+    return values, policy, stats